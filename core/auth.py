@@ -2,16 +2,38 @@
 Authentication utilities for the Developer Efficiency Tracker API
 """
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
+import logging
+import os
+import time
+import base64
 import hashlib
+import hmac
+import threading
 import jwt
 from fastapi import HTTPException, status, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from .config import get_settings
 
+logger = logging.getLogger(__name__)
+
 security = HTTPBearer(auto_error=False)  # Don't auto-error to handle OPTIONS manually
 
+# Developer password hashing (scrypt, stdlib): "scrypt$n$r$p$salt$hash" with base64 salt/hash
+PASSWORD_HASH_SCHEME = "scrypt"
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_DKLEN = 32
+
+# Recently verified tokens: raw token -> decoded payload, reused until the token's exp
+TOKEN_CACHE_SIZE = 4096
+_token_cache: "OrderedDict[str, dict]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
 
 def get_admin_password_hash() -> str:
     """Get the admin password hash"""
@@ -22,7 +44,56 @@ def get_admin_password_hash() -> str:
 def verify_admin_password(password: str) -> bool:
     """Verify admin password"""
     input_hash = hashlib.sha256(password.encode()).hexdigest()
-    return input_hash == get_admin_password_hash()
+    return hmac.compare_digest(input_hash, get_admin_password_hash())
+
+
+def passwords_match(stored_password: str, supplied_password: str) -> bool:
+    """Compare a stored and a supplied password in constant time"""
+    return hmac.compare_digest(stored_password.encode('utf-8'), supplied_password.encode('utf-8'))
+
+
+def is_password_hash(stored_password: str) -> bool:
+    """Check whether a stored password is already hashed (vs. legacy plaintext)"""
+    return stored_password.startswith(f"{PASSWORD_HASH_SCHEME}$")
+
+
+def hash_password(password: str) -> str:
+    """Hash a developer password with scrypt and a random salt"""
+    salt = os.urandom(16)
+    digest = hashlib.scrypt(
+        password.encode('utf-8'), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, dklen=SCRYPT_DKLEN
+    )
+    return "$".join([
+        PASSWORD_HASH_SCHEME, str(SCRYPT_N), str(SCRYPT_R), str(SCRYPT_P),
+        base64.b64encode(salt).decode('ascii'), base64.b64encode(digest).decode('ascii')
+    ])
+
+
+def verify_password(stored_password: str, supplied_password: str) -> bool:
+    """Verify a supplied password against a stored scrypt hash or legacy plaintext password"""
+    if not is_password_hash(stored_password):
+        return passwords_match(stored_password, supplied_password)
+    
+    try:
+        _, n, r, p, salt, expected = stored_password.split("$")
+        expected_digest = base64.b64decode(expected)
+        digest = hashlib.scrypt(
+            supplied_password.encode('utf-8'), salt=base64.b64decode(salt),
+            n=int(n), r=int(r), p=int(p), dklen=len(expected_digest)
+        )
+    except (ValueError, TypeError):
+        return False
+    return hmac.compare_digest(digest, expected_digest)
+
+
+async def verify_password_async(stored_password: str, supplied_password: str) -> bool:
+    """Verify a password in the thread pool so the KDF does not block the event loop"""
+    return await run_in_threadpool(verify_password, stored_password, supplied_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in the thread pool so the KDF does not block the event loop"""
+    return await run_in_threadpool(hash_password, password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -40,13 +111,42 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def _get_cached_token_payload(token: str) -> Optional[dict]:
+    """Return the payload of an already verified, unexpired token"""
+    with _token_cache_lock:
+        payload = _token_cache.get(token)
+        if payload is None:
+            return None
+        if payload.get("exp", 0) <= time.time():
+            del _token_cache[token]
+            return None
+        _token_cache.move_to_end(token)
+        return payload
+
+
+def _cache_token_payload(token: str, payload: dict) -> None:
+    """Remember a verified token's payload, evicting the least recently used tokens"""
+    if "exp" not in payload:
+        return
+    with _token_cache_lock:
+        _token_cache[token] = payload
+        _token_cache.move_to_end(token)
+        while len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+
+
 def verify_token(request: Request, credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
     """Verify JWT token - skip for OPTIONS requests"""
     # Skip authentication for OPTIONS (CORS preflight) requests
     if request.method == "OPTIONS":
-        print("🔧 Skipping authentication for OPTIONS request")
+        logger.debug("🔧 Skipping authentication for OPTIONS request")
         return {"user_type": "options", "sub": "preflight"}
     
+    # Reuse the payload if the token was already decoded during this request
+    cached_payload = getattr(request.state, "token_data", None)
+    if cached_payload is not None:
+        return cached_payload
+    
     if not credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -54,6 +154,12 @@ def verify_token(request: Request, credentials: HTTPAuthorizationCredentials = D
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Tokens are immutable, so a signature verified on an earlier request holds until exp
+    payload = _get_cached_token_payload(credentials.credentials)
+    if payload is not None:
+        request.state.token_data = payload
+        return payload
+    
     settings = get_settings()
     
     try:
@@ -62,10 +168,12 @@ def verify_token(request: Request, credentials: HTTPAuthorizationCredentials = D
             settings.secret_key, 
             algorithms=[settings.algorithm]
         )
-        print(f"🔑 Token verified successfully for user: {payload.get('sub')}")
+        logger.debug("🔑 Token verified successfully for user: %s", payload.get('sub'))
+        _cache_token_payload(credentials.credentials, payload)
+        request.state.token_data = payload
         return payload
     except jwt.PyJWTError as e:
-        print(f"❌ Token verification failed: {str(e)}")
+        logger.warning("❌ Token verification failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -27,6 +27,8 @@ class Settings(BaseSettings):
     
     # Database/Storage
     data_directory: str = "data"
+    teams_config_cache_ttl: float = 30.0  # seconds
+    team_data_cache_ttl: float = 5.0  # seconds a cached team frame is served without revalidating against S3
     
     class Config:
         env_file = ".env"
@@ -3,25 +3,103 @@ Standalone database and data management for the FastAPI backend
 """
 
 import os
-import json
+import io
+import asyncio
+import logging
+import copy
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
+import orjson
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from datetime import datetime
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 import urllib.parse
 
+from core.serialization import DATE_COLUMNS, arrow_compatible, write_dataframe_xlsx
+
+
+logger = logging.getLogger(__name__)
+
+# Columns compared/grouped as strings on hot paths; Arrow-backed storage lets
+# .str operations and equality checks run as vectorized compute kernels
+ARROW_STRING_COLUMNS = ('Developer_Name',)
+
+# Free-text identifier columns; legacy files mix numbers into them (Story_ID 'ABC-1' and 42),
+# which parquet and Arrow reject in an object column, so they are always stored as strings
+TEXT_COLUMNS = ('Story_ID', 'Notes')
+
+# Low-cardinality keys and flags; categorical codes make groupby an integer-keyed operation
+# and let yes_mask() compare only the handful of distinct values.
+# Group on these with observed=True so categories absent after filtering are not emitted.
+# The descriptive label columns repeat a few values on every row, so codes also shrink
+# cached frames, and the parquet mirror stores all of them dictionary-encoded.
+CATEGORY_COLUMNS = ('Category', 'Team_Name', 'Copilot_Used', 'Technology', 'Task_Type', 'Completion_Type')
+
+# Stable per-entry key used by deletes; files written before it existed get row positions
+ENTRY_ID_COLUMN = 'Entry_ID'
+
+# Hour columns aggregated by every dashboard; kept as contiguous float64 arrays
+NUMERIC_COLUMNS = ('Original_Estimate_Hours', 'Efficiency_Gained_Hours')
+
+# Upper bound on concurrent S3 reads when loading several teams at once
+MAX_PARALLEL_LOADS = 8
+
+# Number of parsed team DataFrames kept in memory, revalidated against the S3 ETag
+TEAM_DATA_CACHE_SIZE = 64
+
+# Parquet mirror codec; zstd files are markedly smaller than snappy at similar decode speed
+PARQUET_COMPRESSION = 'zstd'
+PARQUET_COMPRESSION_LEVEL = 3
+
+# Shared S3 client; boto3 clients are thread-safe, and one connection pool sized for the
+# parallel team loads and threadpool handlers avoids per-manager pools and TLS handshakes
+S3_MAX_POOL_CONNECTIONS = 50
+S3_MAX_ATTEMPTS = 3
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """Process-wide S3 client with a pooled, keep-alive connection configuration"""
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = boto3.client('s3', config=Config(
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                    tcp_keepalive=True,
+                    # Standard mode retries throttling and transient errors with backoff on the warm pool
+                    retries={'max_attempts': S3_MAX_ATTEMPTS, 'mode': 'standard'}
+                ))
+    return _s3_client
+
 
 class DataManager:
     """Handles data storage and retrieval operations - S3 ONLY"""
     
-    def __init__(self, data_directory: str = "data", use_s3: bool = False, s3_bucket: str = None):
+    def __init__(self, data_directory: str = "data", use_s3: bool = False, s3_bucket: str = None,
+                 cache_ttl: float = 5.0):
         self.data_directory = Path(data_directory)
         self.use_s3 = use_s3
         self.s3_bucket = s3_bucket
         
+        # LRU of parsed team data shared by every endpoint:
+        # team_name -> (s3_key, etag, DataFrame, fresh_until monotonic time).
+        # Within cache_ttl of its last validation a frame is served without asking S3.
+        self.cache_ttl = cache_ttl
+        self._frame_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._frame_cache_lock = threading.Lock()
+        
         if not self.use_s3 or not self.s3_bucket:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -29,7 +107,7 @@ class DataManager:
             )
             
         try:
-            self.s3_client = boto3.client('s3')
+            self.s3_client = get_s3_client()
             # Test S3 connection
             self.s3_client.head_bucket(Bucket=self.s3_bucket)
         except Exception as e:
@@ -38,128 +116,429 @@ class DataManager:
                 detail=f"Failed to connect to S3: {str(e)}"
             )
     
-    def load_team_data(self, team_name: str) -> pd.DataFrame:
-        """Load team data from S3 only - Returns empty DataFrame if file doesn't exist"""
+    def _get_cached_frame(self, team_name: str) -> Optional[tuple]:
+        """Return the cached (s3_key, etag, DataFrame, fresh_until) for a team, if any"""
+        with self._frame_cache_lock:
+            cached = self._frame_cache.get(team_name)
+            if cached is not None:
+                self._frame_cache.move_to_end(team_name)
+            return cached
+    
+    def _cache_frame(self, team_name: str, s3_key: str, etag: Optional[str], df: pd.DataFrame) -> None:
+        """Remember a parsed team DataFrame along with the S3 ETag it was read (or validated) at"""
+        if not etag:
+            return
+        with self._frame_cache_lock:
+            self._frame_cache[team_name] = (s3_key, etag, df, time.monotonic() + self.cache_ttl)
+            self._frame_cache.move_to_end(team_name)
+            while len(self._frame_cache) > TEAM_DATA_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+    
+    def invalidate_team_data(self, team_name: str) -> None:
+        """Drop a team's cached DataFrame"""
+        with self._frame_cache_lock:
+            self._frame_cache.pop(team_name, None)
+    
+    @staticmethod
+    def _team_data_keys(team_name: str) -> List[str]:
+        """S3 key variations a team's xlsx may be stored under, in lookup order"""
+        # Try multiple S3 key variations to handle different naming conventions
+        return [
+            # Original URL-encoded approach (this one is working from logs)
+            f"teams/{urllib.parse.quote(team_name, safe='')}_efficiency_data.xlsx",
+            # Replace spaces with underscores
+            f"teams/{team_name.replace(' ', '_')}_efficiency_data.xlsx",
+            # Replace spaces with hyphens
+            f"teams/{team_name.replace(' ', '-')}_efficiency_data.xlsx",
+            # No spaces (concatenated)
+            f"teams/{team_name.replace(' ', '')}_efficiency_data.xlsx",
+            # Original team name as-is
+            f"teams/{team_name}_efficiency_data.xlsx"
+        ]
+    
+    def get_team_data_etag(self, team_name: str) -> Optional[str]:
+        """S3 ETag of the team's xlsx (via HEAD, no download), or None if it doesn't exist"""
+        cached = self._get_cached_frame(team_name)
+        if cached is not None and time.monotonic() < cached[3]:
+            return cached[1]
+        
+        for s3_key in dict.fromkeys(self._team_data_keys(team_name)):
+            try:
+                return self.s3_client.head_object(Bucket=self.s3_bucket, Key=s3_key).get('ETag')
+            except ClientError as e:
+                if e.response['Error']['Code'] in ['NoSuchKey', '404', 'NotFound']:
+                    continue
+                logger.warning("⚠️ S3 error checking key %s: %s", s3_key, e)
+                return None
+        return None
+    
+    def load_team_data(self, team_name: str, copy: bool = True, revalidate: bool = False) -> pd.DataFrame:
+        """Load team data from S3 only - Returns empty DataFrame if file doesn't exist.
+        
+        Frames are cached; pass copy=False only if the caller will not modify the frame.
+        Pass revalidate=True before a load-modify-save so a cached frame is always checked
+        against S3 (a conditional GET), even within cache_ttl; rows written by other
+        instances are then not overwritten.
+        """
         try:
-            # Try multiple S3 key variations to handle different naming conventions
-            key_variations = [
-                # Original URL-encoded approach (this one is working from logs)
-                f"teams/{urllib.parse.quote(team_name, safe='')}_efficiency_data.xlsx",
-                # Replace spaces with underscores
-                f"teams/{team_name.replace(' ', '_')}_efficiency_data.xlsx",
-                # Replace spaces with hyphens
-                f"teams/{team_name.replace(' ', '-')}_efficiency_data.xlsx",
-                # No spaces (concatenated)
-                f"teams/{team_name.replace(' ', '')}_efficiency_data.xlsx",
-                # Original team name as-is
-                f"teams/{team_name}_efficiency_data.xlsx"
-            ]
-            
-            # Create temp file for S3 download
-            encoded_team_name = urllib.parse.quote(team_name, safe='')
-            temp_file = self.data_directory / f"temp_{encoded_team_name}_efficiency_data.xlsx"
-            self.data_directory.mkdir(exist_ok=True)
+            key_variations = self._team_data_keys(team_name)
             
             last_error = None
+            cached = self._get_cached_frame(team_name)
+            if not revalidate and cached is not None and time.monotonic() < cached[3]:
+                return cached[2].copy() if copy else cached[2]
             
             for s3_key in key_variations:
                 try:
-                    print(f"🔍 Loading S3 key: {s3_key}")
-                    response = self.s3_client.get_object(Bucket=self.s3_bucket, Key=s3_key)
+                    if cached is None or cached[0] != s3_key:
+                        mirror = self._load_parquet_mirror(s3_key)
+                        if mirror is not None:
+                            df, etag = mirror
+                            self._cache_frame(team_name, s3_key, etag, df)
+                            logger.debug("✅ Successfully loaded %s rows from parquet mirror", len(df))
+                            return df.copy() if copy else df
                     
-                    # Save to temp file and read
-                    with open(temp_file, 'wb') as f:
-                        f.write(response['Body'].read())
+                    logger.debug("🔍 Loading S3 key: %s", s3_key)
+                    get_kwargs = {"Bucket": self.s3_bucket, "Key": s3_key}
+                    if cached is not None and cached[0] == s3_key:
+                        # Conditional GET: S3 answers 304 if the object is unchanged
+                        get_kwargs["IfNoneMatch"] = cached[1]
+                    response = self.s3_client.get_object(**get_kwargs)
                     
-                    df = pd.read_excel(temp_file)
+                    # Parse straight from memory; no temp file, so concurrent loads are safe
+                    df = self._apply_column_dtypes(pd.read_excel(io.BytesIO(response['Body'].read())))
+                    self._cache_frame(team_name, s3_key, response.get('ETag'), df)
                     
-                    # Clean up temp file
-                    if temp_file.exists():
-                        temp_file.unlink()
-                        
-                    print(f"✅ Successfully loaded {len(df)} rows from S3")
-                    return df
+                    logger.debug("✅ Successfully loaded %s rows from S3", len(df))
+                    return df.copy() if copy else df
                     
                 except ClientError as e:
                     error_code = e.response['Error']['Code']
+                    if error_code in ['304', 'NotModified'] and cached is not None:
+                        logger.debug("♻️ Team data unchanged in S3, using cached %s rows", len(cached[2]))
+                        self._cache_frame(team_name, cached[0], cached[1], cached[2])
+                        return cached[2].copy() if copy else cached[2]
                     if error_code in ['NoSuchKey', '404', 'NotFound']:
                         # Key not found, try next variation
                         last_error = e
                         continue
                     else:
                         # For other S3 errors, log but continue trying other keys
-                        print(f"⚠️ S3 error with key {s3_key}: {str(e)}")
+                        logger.warning("⚠️ S3 error with key %s: %s", s3_key, e)
                         last_error = e
                         continue
                 except Exception as file_error:
                     # Handle any file processing errors
-                    print(f"⚠️ File processing error with key {s3_key}: {str(file_error)}")
+                    logger.warning("⚠️ File processing error with key %s: %s", s3_key, file_error)
                     last_error = file_error
                     continue
-                finally:
-                    # Ensure temp file is cleaned up after each attempt
-                    if temp_file.exists():
-                        temp_file.unlink()
             
             # If we get here, none of the key variations worked
-            print(f"📁 No existing data file found for team '{team_name}' using any naming convention")
+            logger.debug("📁 No existing data file found for team '%s' using any naming convention", team_name)
             return pd.DataFrame()
                     
         except Exception as e:
             # For any other unexpected errors, log and return empty DataFrame to prevent 500 errors
-            print(f"⚠️ Unexpected error in load_team_data (returning empty data): {str(e)}")
-            print(f"   Exception type: {type(e).__name__}")
+            logger.warning("⚠️ Unexpected error in load_team_data (returning empty data): %s", e)
+            logger.warning("   Exception type: %s", type(e).__name__)
             return pd.DataFrame()
     
+    def load_teams_data(self, team_names: List[str], copy: bool = True) -> Dict[str, pd.DataFrame]:
+        """Load several teams' data concurrently, returning frames keyed by team name"""
+        team_names = list(dict.fromkeys(team_names))
+        if not team_names:
+            return {}
+        
+        # Each load is dominated by S3 round-trip latency; boto3 clients are thread-safe
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_LOADS, len(team_names))) as pool:
+            frames = pool.map(lambda team_name: self.load_team_data(team_name, copy=copy), team_names)
+            return dict(zip(team_names, frames))
+    
+    def get_objects_fingerprint(self, *prefixes: str) -> Optional[str]:
+        """Digest of the keys, ETags and modification times of S3 objects under the given prefixes"""
+        try:
+            digest = hashlib.blake2b(digest_size=16)
+            
+            for prefix in prefixes:
+                list_kwargs = {"Bucket": self.s3_bucket, "Prefix": prefix}
+                while True:
+                    response = self.s3_client.list_objects_v2(**list_kwargs)
+                    for obj in response.get('Contents', []):
+                        digest.update(f"{obj['Key']}|{obj.get('ETag', '')}|{obj['LastModified'].isoformat()}\n".encode('utf-8'))
+                    
+                    if not response.get('IsTruncated'):
+                        break
+                    list_kwargs['ContinuationToken'] = response['NextContinuationToken']
+            
+            return digest.hexdigest()
+            
+        except Exception as e:
+            logger.warning("⚠️ Could not fingerprint S3 objects: %s", e)
+            return None
+    
+    @staticmethod
+    def _apply_column_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """Normalize hot columns: numeric hours as float64, week bounds as datetimes, string keys as Arrow-backed strings or categoricals"""
+        for column in NUMERIC_COLUMNS:
+            if column in df.columns:
+                df[column] = pd.to_numeric(df[column], errors='coerce').astype('float64')
+        # Week bounds are parsed once here so date filters and monthly grouping never re-parse strings
+        for column in DATE_COLUMNS:
+            if column in df.columns:
+                df[column] = pd.to_datetime(df[column], errors='coerce')
+        for column in ARROW_STRING_COLUMNS + TEXT_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype('string[pyarrow]')
+        for column in CATEGORY_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype('category')
+        # Any other column with mixed value types is stored as strings too, so the parquet mirror can be written
+        return DataManager._assign_entry_ids(arrow_compatible(df))
+    
+    @staticmethod
+    def _assign_entry_ids(df: pd.DataFrame) -> pd.DataFrame:
+        """Ensure every row has an integer Entry_ID, numbering rows without one after the current maximum"""
+        if ENTRY_ID_COLUMN not in df.columns:
+            df.insert(0, ENTRY_ID_COLUMN, range(len(df)))
+            return df
+        
+        ids = pd.to_numeric(df[ENTRY_ID_COLUMN], errors='coerce')
+        missing = ids.isna()
+        if missing.any():
+            start = 0 if missing.all() else int(ids.max()) + 1
+            ids[missing] = range(start, start + int(missing.sum()))
+        df[ENTRY_ID_COLUMN] = ids.astype('int64')
+        return df
+    
+    @staticmethod
+    def _parquet_key(xlsx_key: str) -> str:
+        """S3 key of the parquet mirror kept next to a team's xlsx file"""
+        return f"{xlsx_key[:-len('.xlsx')]}.parquet"
+    
+    def _load_parquet_mirror(self, xlsx_key: str) -> Optional[tuple]:
+        """Load (DataFrame, xlsx ETag) from the parquet mirror if it is at least as new as the xlsx"""
+        try:
+            mirror = self.s3_client.get_object(Bucket=self.s3_bucket, Key=self._parquet_key(xlsx_key))
+        except ClientError:
+            return None
+        
+        try:
+            # The xlsx stays the source of truth; ignore a mirror older than a manual upload
+            xlsx_head = self.s3_client.head_object(Bucket=self.s3_bucket, Key=xlsx_key)
+            if mirror['LastModified'] < xlsx_head['LastModified']:
+                logger.warning("⚠️ Parquet mirror for %s is stale, falling back to xlsx", xlsx_key)
+                return None
+            
+            df = self._apply_column_dtypes(pd.read_parquet(io.BytesIO(mirror['Body'].read())))
+            return df, xlsx_head.get('ETag')
+        except Exception as e:
+            logger.warning("⚠️ Could not use parquet mirror for %s: %s", xlsx_key, e)
+            return None
+    
+    def _save_parquet_mirror(self, xlsx_key: str, data: pd.DataFrame) -> None:
+        """Write the parquet mirror for a team's xlsx; a failed write only costs read speed"""
+        try:
+            buffer = io.BytesIO()
+            data.to_parquet(buffer, index=False, compression=PARQUET_COMPRESSION, compression_level=PARQUET_COMPRESSION_LEVEL)
+            self.s3_client.put_object(Bucket=self.s3_bucket, Key=self._parquet_key(xlsx_key), Body=buffer.getvalue())
+        except Exception as e:
+            logger.warning("⚠️ Could not write parquet mirror for %s: %s", xlsx_key, e)
+    
     def save_team_data(self, team_name: str, data: pd.DataFrame) -> bool:
         """Save team data to S3 only"""
         try:
             # URL encode team name for S3 key to handle spaces and special characters
             encoded_team_name = urllib.parse.quote(team_name, safe='')
             
-            # Create temp file
-            temp_file = self.data_directory / f"temp_{encoded_team_name}_efficiency_data.xlsx"
-            self.data_directory.mkdir(exist_ok=True)
+            s3_key = f"teams/{encoded_team_name}_efficiency_data.xlsx"
             
             try:
-                data.to_excel(temp_file, index=False)
+                # Build the workbook in memory with the row-order writer (no temp file, no pandas.to_excel)
+                buffer = io.BytesIO()
+                write_dataframe_xlsx(data, buffer)
+                
+                logger.debug("🔄 Uploading to S3 key: %s", s3_key)
+                response = self.s3_client.put_object(Bucket=self.s3_bucket, Key=s3_key, Body=buffer.getvalue())
                 
-                # Upload to S3
-                s3_key = f"teams/{encoded_team_name}_efficiency_data.xlsx"
-                print(f"🔄 Uploading to S3 key: {s3_key}")
-                self.s3_client.upload_file(str(temp_file), self.s3_bucket, s3_key)
+                # Keep the frame just written as the cached copy for the new ETag, so the next
+                # load revalidates with a 304 instead of downloading and re-parsing the file
+                # (a shallow copy is enough: dtype normalization replaces columns, it never writes into them)
+                saved = self._apply_column_dtypes(data.copy(deep=False))
+                self.invalidate_team_data(team_name)
+                self._cache_frame(team_name, s3_key, response.get('ETag'), saved)
                 
-                # Clean up temp file
-                temp_file.unlink()
-                print(f"✅ Successfully saved to S3")
+                # Columnar mirror for fast reads; written after the xlsx so it is never older
+                self._save_parquet_mirror(s3_key, saved)
+                
+                logger.debug("✅ Successfully saved to S3")
                 return True
                 
             except Exception as e:
-                # Clean up temp file on error
-                if temp_file.exists():
-                    temp_file.unlink()
-                print(f"❌ Error saving to S3: {str(e)}")
+                logger.error("❌ Error saving to S3: %s", e)
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail=f"Failed to save team data to S3: {str(e)}"
                 )
                 
         except Exception as e:
-            print(f"❌ Unexpected error in save_team_data: {str(e)}")
+            logger.error("❌ Unexpected error in save_team_data: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error saving team data: {str(e)}"
             )
 
 
+# Per-team locks serializing load-modify-save sequences (entry create/delete) within this process
+_team_write_locks: Dict[str, asyncio.Lock] = {}
+
+
+def team_write_lock(team_name: str) -> asyncio.Lock:
+    """Lock to hold across a team's load-modify-save so concurrent writers don't drop each other's changes"""
+    lock = _team_write_locks.get(team_name)
+    if lock is None:
+        lock = _team_write_locks[team_name] = asyncio.Lock()
+    return lock
+
+
+# Group-commit flushes still running; referenced here until done so a flush whose callers were
+# cancelled is not garbage collected mid-save
+_running_flushes: set = set()
+
+
+async def run_shielded(coro) -> None:
+    """Run a coroutine as its own task and await it shielded, so cancelling the caller doesn't abandon it.
+    
+    A cancelled caller stops waiting but the task still completes, e.g. a save already handed to the threadpool.
+    """
+    task = asyncio.ensure_future(coro)
+    _running_flushes.add(task)
+    task.add_done_callback(_running_flushes.discard)
+    await asyncio.shield(task)
+
+
+# Serializes teams config load-modify-save sequences within this process
+_teams_config_write_lock: Optional[asyncio.Lock] = None
+
+
+def teams_config_write_lock() -> asyncio.Lock:
+    """Lock to hold across a teams config load-modify-save so concurrent edits don't drop each other's changes"""
+    global _teams_config_write_lock
+    if _teams_config_write_lock is None:
+        _teams_config_write_lock = asyncio.Lock()
+    return _teams_config_write_lock
+
+
+# Serializes team settings load-modify-save sequences within this process
+_team_settings_write_lock: Optional[asyncio.Lock] = None
+
+
+def team_settings_write_lock() -> asyncio.Lock:
+    """Lock to hold across a team settings load-modify-save so concurrent edits don't drop each other's changes"""
+    global _team_settings_write_lock
+    if _team_settings_write_lock is None:
+        _team_settings_write_lock = asyncio.Lock()
+    return _team_settings_write_lock
+
+
+# Teams config edits waiting for the next save: [(mutation, future resolved with the save result)]
+_pending_config_updates: List[tuple] = []
+
+
+async def update_teams_config(mutation: Callable[[Dict[str, Any]], None]) -> bool:
+    """Apply a mutation to the teams config and save it, together with any edits queued alongside it.
+    
+    Concurrent edits are group-committed: they are applied in order to one freshly revalidated
+    copy of the config and saved with a single S3 write, and each caller gets that save's result.
+    The mutation edits the config dict in place; an exception it raises (e.g. an HTTPException
+    for a missing team) is re-raised to this caller only, and the other queued edits still apply.
+    """
+    saved = asyncio.get_running_loop().create_future()
+    _pending_config_updates.append((mutation, saved))
+    
+    # The flush runs shielded, so a cancelled request can't abandon a batch whose save is underway
+    await run_shielded(_flush_teams_config_updates())
+    return await saved
+
+
+async def _flush_teams_config_updates() -> None:
+    """Apply all queued teams config edits in order and save once, resolving each waiter"""
+    # Whoever takes the lock first applies every queued edit to one copy and saves it once;
+    # later holders find their edit already written
+    async with teams_config_write_lock():
+        batch = _pending_config_updates[:]
+        _pending_config_updates.clear()
+        if batch:
+            await _save_teams_config_updates(batch)
+
+
+async def _save_teams_config_updates(batch: List[tuple]) -> None:
+    """Apply a batch of queued edits to the current config and save it with one S3 write"""
+    teams_config_manager = get_teams_config_manager_instance()
+    applied = []
+    try:
+        teams_config = await run_in_threadpool(teams_config_manager.load_teams_config, for_update=True)
+        
+        for mutation, saved in batch:
+            try:
+                mutation(teams_config)
+            except Exception as e:
+                saved.set_exception(e)
+            else:
+                applied.append(saved)
+        
+        if not applied:
+            return
+        save_result = await run_in_threadpool(teams_config_manager.save_teams_config, teams_config)
+    except Exception as e:
+        for _, saved in batch:
+            if not saved.done():
+                saved.set_exception(e)
+        return
+    
+    for saved in applied:
+        saved.set_result(save_result)
+
+
+def yes_mask(series: pd.Series) -> np.ndarray:
+    """Boolean array marking case-insensitive 'Yes' values of a Yes/No column such as Copilot_Used"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Compare the distinct values once, then look each row's code up (code -1, missing, hits the trailing False)
+        is_yes = np.asarray(series.cat.categories.astype(str).str.upper() == 'YES', dtype=bool)
+        return np.append(is_yes, False)[series.cat.codes.to_numpy()]
+    return series.str.upper().eq('YES').to_numpy(dtype=bool, na_value=False)
+
+
+def normalize_developers(team_config: Any) -> List[Dict[str, Any]]:
+    """Return a team's developers as dicts, handling both old and new config structures.
+    
+    Dict entries are returned as-is (not copied), so changes to them apply to the config.
+    """
+    if isinstance(team_config, dict) and 'developers' in team_config:
+        developers = team_config['developers']
+    elif isinstance(team_config, list):
+        developers = team_config
+    else:
+        return []
+    
+    return [dev if isinstance(dev, dict) else {'name': str(dev)} for dev in developers]
+
+
 class TeamsConfigManager:
     """Manages team configuration data - S3 ONLY"""
     
-    def __init__(self, data_directory: str = "data", use_s3: bool = False, s3_bucket: str = None):
+    def __init__(self, data_directory: str = "data", use_s3: bool = False, s3_bucket: str = None,
+                 cache_ttl: float = 30.0):
         self.data_directory = Path(data_directory)
         self.use_s3 = use_s3
         self.s3_bucket = s3_bucket
         
+        # In-process cache of the parsed config and its developer lookup indexes:
+        # (config, email_index, name_index_by_team, expires_at monotonic time, S3 ETag)
+        self.cache_ttl = cache_ttl
+        self._cache: Optional[tuple] = None
+        # Serializes refreshes so concurrent threadpool readers share one S3 round-trip
+        self._refresh_lock = threading.Lock()
+        
         if not self.use_s3 or not self.s3_bucket:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -167,7 +546,7 @@ class TeamsConfigManager:
             )
             
         try:
-            self.s3_client = boto3.client('s3')
+            self.s3_client = get_s3_client()
             # Test S3 connection
             self.s3_client.head_bucket(Bucket=self.s3_bucket)
         except Exception as e:
@@ -176,24 +555,94 @@ class TeamsConfigManager:
                 detail=f"Failed to connect to S3: {str(e)}"
             )
     
-    def load_teams_config(self) -> Dict[str, List[Dict[str, str]]]:
-        """Load teams configuration from S3 only"""
+    def load_teams_config(self, for_update: bool = False) -> Dict[str, List[Dict[str, str]]]:
+        """Load teams configuration, served from the in-process cache while it is fresh.
+        
+        The returned dict is shared with the cache; pass for_update=True to get a
+        private copy that is safe to mutate before calling save_teams_config. That path
+        always revalidates against S3 first (a conditional GET, usually a 304), so edits
+        made by other instances within the TTL are not overwritten.
+        """
+        if for_update:
+            return copy.deepcopy(self._revalidate(force=True)[0])
+        return self._get_cached()[0]
+    
+    def get_email_index(self) -> Dict[str, List[tuple]]:
+        """Map lower-cased developer email -> [(team_name, developer dict), ...] in config order"""
+        return self._get_cached()[1]
+    
+    def get_name_index(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Map team name -> {developer name: developer dict}"""
+        return self._get_cached()[2]
+    
+    def _get_cached(self) -> tuple:
+        """Return the cache entry, revalidating it against S3 once the TTL has expired"""
+        cached = self._cache
+        if cached is not None and time.monotonic() < cached[3]:
+            return cached
+        return self._revalidate()
+    
+    def refresh_cache(self) -> None:
+        """Revalidate the cached config against S3 now, ahead of its TTL expiring"""
+        self._revalidate(force=True)
+    
+    def _revalidate(self, force: bool = False) -> tuple:
+        """Refresh the cache entry with a conditional GET if it is missing, expired, or force is set"""
+        with self._refresh_lock:
+            # Another reader may have refreshed the entry while this one waited
+            cached = self._cache
+            if force or cached is None or time.monotonic() >= cached[3]:
+                fetched = self._fetch_teams_config(if_none_match=cached[4] if cached is not None else None)
+                if fetched is None:
+                    # Unchanged in S3: keep the parsed config and indexes for another TTL
+                    cached = cached[:3] + (time.monotonic() + self.cache_ttl, cached[4])
+                else:
+                    cached = self._make_cache_entry(*fetched)
+                self._cache = cached
+            return cached
+    
+    def _make_cache_entry(self, config: Dict[str, Any], etag: Optional[str] = None) -> tuple:
+        """Build the cache entry for a config, indexing developers in a single pass"""
+        email_index: Dict[str, List[tuple]] = {}
+        name_index_by_team: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        
+        for team_name, team_config in config.items():
+            team_index = name_index_by_team.setdefault(team_name, {})
+            for dev in normalize_developers(team_config):
+                team_index.setdefault(dev.get('name', ''), dev)
+                
+                dev_email = dev.get('email', '')
+                if dev_email:
+                    email_index.setdefault(dev_email.lower(), []).append((team_name, dev))
+        
+        return (config, email_index, name_index_by_team, time.monotonic() + self.cache_ttl, etag)
+    
+    def invalidate_cache(self) -> None:
+        """Drop the cached teams configuration"""
+        self._cache = None
+    
+    def _fetch_teams_config(self, if_none_match: Optional[str] = None) -> Optional[tuple]:
+        """Load (teams configuration, ETag) from S3 only; None if it still matches if_none_match"""
         try:
             s3_key = "config/teams_config.json"
             
             try:
-                response = self.s3_client.get_object(Bucket=self.s3_bucket, Key=s3_key)
-                config_data = response['Body'].read().decode('utf-8')
-                return json.loads(config_data)
+                get_kwargs = {"Bucket": self.s3_bucket, "Key": s3_key}
+                if if_none_match:
+                    get_kwargs["IfNoneMatch"] = if_none_match
+                response = self.s3_client.get_object(**get_kwargs)
+                return orjson.loads(response['Body'].read()), response.get('ETag')
             except ClientError as e:
                 error_code = e.response['Error']['Code']
+                if error_code in ['304', 'NotModified'] and if_none_match:
+                    return None
                 if error_code in ['NoSuchKey', '404', 'NotFound']:
                     # File doesn't exist, return empty config instead of raising exception
-                    print(f"📁 No teams config file found in S3, returning empty config")
-                    return {}
+                    logger.info("📁 No teams config file found in S3, returning empty config")
+                    return {}, None
                 else:
                     # Other S3 errors should still raise exceptions
-                    print(f"❌ S3 error loading teams config: {str(e)}")
+                    logger.error("❌ S3 error loading teams config: %s", e)
                     raise HTTPException(
                         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                         detail=f"Failed to load teams config from S3: {str(e)}"
@@ -203,7 +652,7 @@ class TeamsConfigManager:
             # Re-raise HTTPExceptions as-is
             raise
         except Exception as e:
-            print(f"❌ Unexpected error loading teams config: {str(e)}")
+            logger.error("❌ Unexpected error loading teams config: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error loading teams config: {str(e)}"
@@ -211,19 +660,30 @@ class TeamsConfigManager:
     
     def save_teams_config(self, config: Dict[str, List[Dict[str, str]]]) -> bool:
         """Save teams configuration to S3 only"""
+        # Edits that leave the config as it was (e.g. an update with no changes) need no S3 write
+        cached = self._cache
+        if cached is not None and config == cached[0]:
+            return True
+        
         try:
             s3_key = "config/teams_config.json"
-            config_json = json.dumps(config, indent=2)
+            # orjson keeps the file's 2-space layout and writes UTF-8 bytes directly
+            config_json = orjson.dumps(config, option=orjson.OPT_INDENT_2)
             
-            self.s3_client.put_object(
+            response = self.s3_client.put_object(
                 Bucket=self.s3_bucket,
                 Key=s3_key,
                 Body=config_json,
+                ContentLength=len(config_json),
                 ContentType='application/json'
             )
+            
+            # Write-through so subsequent reads see the new config without an S3 round-trip
+            self._cache = self._make_cache_entry(config, response.get('ETag'))
             return True
             
         except Exception as e:
+            self.invalidate_cache()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to save teams config to S3: {str(e)}"
@@ -245,7 +705,7 @@ class TeamSettingsManager:
             )
             
         try:
-            self.s3_client = boto3.client('s3')
+            self.s3_client = get_s3_client()
             # Test S3 connection
             self.s3_client.head_bucket(Bucket=self.s3_bucket)
         except Exception as e:
@@ -297,8 +757,7 @@ class TeamSettingsManager:
             
             try:
                 response = self.s3_client.get_object(Bucket=self.s3_bucket, Key=s3_key)
-                settings_data = response['Body'].read().decode('utf-8')
-                return json.loads(settings_data)
+                return orjson.loads(response['Body'].read())
             except ClientError as e:
                 if e.response['Error']['Code'] == 'NoSuchKey':
                     # File doesn't exist, create default settings in S3
@@ -320,12 +779,13 @@ class TeamSettingsManager:
         """Save team settings to S3 only"""
         try:
             s3_key = "config/team_settings.json"
-            settings_json = json.dumps(settings, indent=2)
+            settings_json = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
             
             self.s3_client.put_object(
                 Bucket=self.s3_bucket,
                 Key=s3_key,
                 Body=settings_json,
+                ContentLength=len(settings_json),
                 ContentType='application/json'
             )
             return True
@@ -350,13 +810,15 @@ def init_data_managers(settings):
     _data_manager = DataManager(
         data_directory=settings.data_directory,
         use_s3=settings.use_s3,
-        s3_bucket=settings.s3_bucket_name
+        s3_bucket=settings.s3_bucket_name,
+        cache_ttl=settings.team_data_cache_ttl
     )
     
     _teams_config_manager = TeamsConfigManager(
         data_directory=settings.data_directory,
         use_s3=settings.use_s3,
-        s3_bucket=settings.s3_bucket_name
+        s3_bucket=settings.s3_bucket_name,
+        cache_ttl=settings.teams_config_cache_ttl
     )
     
     _team_settings_manager = TeamSettingsManager(
@@ -0,0 +1,46 @@
+"""
+HTTP conditional request helpers (ETag / If-None-Match) for the Developer Efficiency Tracker API
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong ETag from the given version parts"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\x00')
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """Check whether the request's If-None-Match header matches the ETag"""
+    if not etag:
+        return False
+
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    # Weak comparison, as required for If-None-Match
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def set_cache_headers(response: Response, etag: Optional[str], max_age: int = 30) -> None:
+    """Attach ETag and revalidation headers to a response"""
+    if not etag:
+        return
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = f"private, max-age={max_age}, must-revalidate"
+
+
+def not_modified_response(etag: str, max_age: int = 30) -> Response:
+    """Build an empty 304 Not Modified response"""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_cache_headers(response, etag, max_age)
+    return response
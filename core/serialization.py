@@ -0,0 +1,114 @@
+"""
+DataFrame serialization helpers for JSON API responses
+"""
+
+from typing import Any, BinaryIO, Dict, Iterator, List
+
+import pandas as pd
+import pyarrow as pa
+import xlsxwriter
+
+# Date-only columns (week bounds), rendered without a time part
+DATE_COLUMNS = ('Week', 'Week_End')
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+DATE_FORMAT = '%Y-%m-%d'
+XLSX_DATETIME_FORMAT = 'yyyy-mm-dd hh:mm:ss'
+XLSX_DATE_FORMAT = 'yyyy-mm-dd'
+ARROW_STREAM_MEDIA_TYPE = 'application/vnd.apache.arrow.stream'
+CSV_CHUNK_ROWS = 10_000
+# pandas.api.types.infer_dtype results for object columns that Arrow cannot convert as-is
+MIXED_INFERRED_TYPES = ('mixed', 'mixed-integer')
+
+
+def dataframe_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a DataFrame to JSON-safe records (NaN -> None, datetimes -> str) using column-level coercion"""
+    if df.empty:
+        return []
+
+    names = df.columns.tolist()
+    columns = []
+    for name in names:
+        series = df[name]
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            series = series.dt.strftime(DATE_FORMAT if name in DATE_COLUMNS else TIMESTAMP_FORMAT)
+        elif isinstance(series.dtype, pd.PeriodDtype):
+            series = series.astype(str).where(series.notna())
+        columns.append(series.astype(object).where(series.notna(), None).tolist())
+
+    # Zipping native per-column lists is much cheaper than DataFrame.to_dict('records'),
+    # which boxes every cell individually
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def dataframe_to_arrow_stream(df: pd.DataFrame) -> bytes:
+    """Encode a DataFrame as an Arrow IPC stream; column buffers are copied as-is, with no per-cell objects"""
+    table = pa.Table.from_pandas(arrow_compatible(df), preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def arrow_compatible(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast object columns holding mixed value types (e.g. legacy Story_IDs 'ABC-1' and 42) to strings, which Arrow requires"""
+    mixed = [
+        column for column in df.columns
+        if pd.api.types.is_object_dtype(df[column].dtype)
+        and pd.api.types.infer_dtype(df[column], skipna=True) in MIXED_INFERRED_TYPES
+    ]
+    if not mixed:
+        return df
+    return df.astype({column: 'string' for column in mixed})
+
+
+def write_dataframe_xlsx(df: pd.DataFrame, output: BinaryIO, sheet_name: str = 'Sheet1') -> None:
+    """Write a DataFrame to an xlsx workbook row by row with xlsxwriter's constant_memory mode"""
+    workbook = xlsxwriter.Workbook(output, {
+        'constant_memory': True,
+        # Skip per-string URL regex matching (and the 65,530 hyperlinks-per-sheet limit)
+        'strings_to_urls': False,
+        'default_date_format': XLSX_DATETIME_FORMAT
+    })
+    worksheet = workbook.add_worksheet(sheet_name)
+
+    # Same header style pandas.to_excel uses
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+    date_format = workbook.add_format({'num_format': XLSX_DATE_FORMAT})
+    column_formats = [date_format if column in DATE_COLUMNS else None for column in df.columns]
+    for col_idx, column in enumerate(df.columns):
+        worksheet.write(0, col_idx, str(column), header_format)
+
+    # Resolve each column's cell writer once instead of type-sniffing every value
+    writers = [_column_writer(worksheet, df[column]) for column in df.columns]
+
+    # constant_memory flushes each row once the next one starts, so cells must be
+    # written in row order (pandas.to_excel writes column by column)
+    columns = [df[column].astype(object).where(df[column].notna(), None).tolist() for column in df.columns]
+    for row_idx, row in enumerate(zip(*columns), start=1):
+        for col_idx, value in enumerate(row):
+            if value is not None:
+                writers[col_idx](row_idx, col_idx, value, column_formats[col_idx])
+
+    workbook.close()
+
+
+def _column_writer(worksheet, series: pd.Series):
+    """Pick the typed xlsxwriter method for a column, falling back to the generic write() for mixed objects"""
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return worksheet.write_boolean
+    if pd.api.types.is_numeric_dtype(dtype):
+        return worksheet.write_number
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return worksheet.write_datetime
+    if pd.api.types.is_string_dtype(dtype) and not pd.api.types.is_object_dtype(dtype):
+        return worksheet.write_string
+    return worksheet.write
+
+
+def iter_dataframe_csv(df: pd.DataFrame, chunk_rows: int = CSV_CHUNK_ROWS) -> Iterator[str]:
+    """Yield a DataFrame as CSV text in row chunks, header first"""
+    yield df.iloc[:0].to_csv(index=False)
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows].to_csv(index=False, header=False)
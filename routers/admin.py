@@ -1,31 +1,114 @@
 """
 Admin router for dashboard and management endpoints
-Made public for testing purposes - remove auth dependencies
 """
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+import logging
+import numpy as np
 import pandas as pd
 from datetime import datetime, date, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from models.schemas import TeamSettings, UpdateSettingsRequest, ApiResponse
+from core.auth import verify_admin_token
+from core.serialization import dataframe_to_records
+from core.http_cache import make_etag, etag_matches, set_cache_headers, not_modified_response
 from core.database import (
     get_data_manager_instance, 
     get_teams_config_manager_instance,
-    get_team_settings_manager_instance
+    get_team_settings_manager_instance,
+    team_settings_write_lock,
+    yes_mask
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
+def _build_trend_rows(grouped: pd.DataFrame, label_key: str, labels) -> List[Dict[str, Any]]:
+    """Build trend rows from a grouped frame, computing all rates as whole-array operations"""
+    time_saved = grouped['Efficiency_Gained_Hours'].to_numpy(dtype=float)
+    estimates = grouped['Original_Estimate_Hours'].to_numpy(dtype=float)
+    copilot_count = grouped['Copilot_Yes'].to_numpy(dtype=float)
+    entries = grouped['Story_ID'].to_numpy(dtype=np.int64)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        efficiency_rate = np.where(estimates > 0, time_saved / estimates * 100, 0.0)
+        copilot_rate = np.where(entries > 0, copilot_count / entries * 100, 0.0)
+    
+    return [
+        {
+            label_key: label,
+            "time_saved": saved,
+            "entries": count,
+            "efficiency_rate": rate,
+            "copilot_usage": usage
+        }
+        for label, saved, count, rate, usage in zip(
+            labels.tolist(),
+            np.round(time_saved, 1).tolist(),
+            entries.tolist(),
+            np.round(efficiency_rate, 1).tolist(),
+            np.round(copilot_rate, 1).tolist()
+        )
+    ]
+
+
+def _build_leaderboard_rows(developer_stats: pd.DataFrame, team_names) -> List[Dict[str, Any]]:
+    """Build developer leaderboard rows from per-developer totals, computing all rates as whole-array operations"""
+    time_saved = developer_stats['total_time_saved'].to_numpy(dtype=float)
+    estimates = developer_stats['total_estimates'].to_numpy(dtype=float)
+    copilot_count = developer_stats['copilot_count'].to_numpy(dtype=float)
+    entries = developer_stats['total_entries'].to_numpy(dtype=np.int64)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        efficiency_rate = np.where(estimates > 0, time_saved / estimates * 100, 0.0)
+        copilot_rate = np.where(entries > 0, copilot_count / entries * 100, 0.0)
+        hours_per_entry = np.where(entries > 0, time_saved / entries, 0.0)
+    
+    return [
+        {
+            "developer_name": developer_name,
+            "team_name": team_name,
+            "total_time_saved": saved,
+            "total_entries": count,
+            "efficiency_rate": rate,
+            "copilot_usage_rate": usage,
+            "avg_hours_per_entry": per_entry
+        }
+        for developer_name, team_name, saved, count, rate, usage, per_entry in zip(
+            developer_stats['developer_name'].tolist(),
+            team_names,
+            time_saved.tolist(),
+            entries.tolist(),
+            efficiency_rate.tolist(),
+            copilot_rate.tolist(),
+            hours_per_entry.tolist()
+        )
+    ]
+
+
 @router.get("/dashboard")
-async def get_admin_dashboard():
-    """Get admin dashboard statistics - Public for testing"""
+async def get_admin_dashboard(
+    request: Request,
+    response: Response,
+    token_data: dict = Depends(verify_admin_token)
+):
+    """Get admin dashboard statistics"""
     try:
         teams_config_manager = get_teams_config_manager_instance()
         data_manager = get_data_manager_instance()
         
-        teams_config = teams_config_manager.load_teams_config()
+        # The dashboard is a pure function of the stored team data and config, plus
+        # the current day for the rolling daily-trends window
+        fingerprint = await run_in_threadpool(data_manager.get_objects_fingerprint, "teams/", "config/teams_config.json")
+        etag = make_etag("admin-dashboard", fingerprint, date.today()) if fingerprint else None
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        
+        teams_config = await run_in_threadpool(teams_config_manager.load_teams_config)
         
         if not teams_config:
             return {
@@ -43,50 +126,56 @@ async def get_admin_dashboard():
                 "efficiency_trends": []
             }
         
-        combined_df = pd.DataFrame()
+        team_frames = []
         team_stats = []
         developer_leaderboard = []
         
+        # Fetch all teams' data concurrently instead of one S3 round-trip after another
+        team_data = await run_in_threadpool(data_manager.load_teams_data, list(teams_config.keys()))
+        
         # Process each team with error handling
         for team_name in teams_config.keys():
             try:
-                print(f"🔄 Processing team: {team_name}")
-                df = data_manager.load_team_data(team_name)
+                logger.debug("🔄 Processing team: %s", team_name)
+                df = team_data[team_name]
                 
                 if not df.empty:
-                    print(f"📊 Team {team_name} - loaded {len(df)} rows")
-                    print(f"📋 Team {team_name} - columns: {list(df.columns)}")
+                    logger.debug("📊 Team %s - loaded %d rows", team_name, len(df))
+                    logger.debug("📋 Team %s - columns: %s", team_name, df.columns)
                     
                     # Validate required columns
                     required_columns = ['Efficiency_Gained_Hours', 'Original_Estimate_Hours', 'Copilot_Used', 'Developer_Name']
                     missing_columns = [col for col in required_columns if col not in df.columns]
                     
                     if missing_columns:
-                        print(f"⚠️ Team {team_name} - missing columns: {missing_columns}")
+                        logger.warning("⚠️ Team %s - missing columns: %s", team_name, missing_columns)
                         # Skip this team's data but continue processing others
                         continue
                     
-                    # Add team identifier to each row
+                    # Add team identifier and a boolean Copilot flag to each row; the flag is
+                    # computed per team while Copilot_Used is still categorical, before concat
                     df['Team_Name'] = team_name
-                    combined_df = pd.concat([combined_df, df], ignore_index=True)
+                    df['Copilot_Yes'] = yes_mask(df['Copilot_Used'])
+                    team_frames.append(df)
                     
                     # Calculate team-specific stats with safe conversions
                     try:
-                        total_time_saved = float(df['Efficiency_Gained_Hours'].fillna(0).sum())
+                        # One numpy mask shared by both sums instead of slicing out a sub-frame
+                        time_saved = df['Efficiency_Gained_Hours'].to_numpy(dtype=float, na_value=np.nan)
+                        estimates = df['Original_Estimate_Hours'].to_numpy(dtype=float, na_value=np.nan)
+                        valid = estimates > 0
+                        
+                        total_time_saved = float(np.nansum(time_saved))
                         total_entries = len(df)
                         
-                        valid_estimates = df[df['Original_Estimate_Hours'].fillna(0) > 0]
-                        if not valid_estimates.empty:
-                            average_efficiency = float(
-                                (valid_estimates['Efficiency_Gained_Hours'].fillna(0).sum() / 
-                                 valid_estimates['Original_Estimate_Hours'].fillna(0).sum()) * 100
-                            )
-                        else:
-                            average_efficiency = 0.0
+                        valid_estimate_total = np.nansum(estimates[valid])
+                        average_efficiency = float(
+                            np.nansum(time_saved[valid]) / valid_estimate_total * 100
+                        ) if valid_estimate_total > 0 else 0.0
                         
                         # Safe Copilot usage calculation
                         copilot_usage_rate = float(
-                            (df['Copilot_Used'].fillna('').str.lower() == 'yes').sum() / len(df) * 100
+                            df['Copilot_Yes'].sum() / len(df) * 100
                         ) if len(df) > 0 else 0.0
                         
                         # Count unique developers
@@ -105,46 +194,34 @@ async def get_admin_dashboard():
                         developer_stats = df.groupby('Developer_Name').agg({
                             'Efficiency_Gained_Hours': 'sum',
                             'Original_Estimate_Hours': 'sum',
-                            'Copilot_Used': lambda x: (x.str.lower() == 'yes').sum(),
+                            'Copilot_Yes': 'sum',
                             'Story_ID': 'count'  # Total entries
                         }).reset_index()
                         
                         developer_stats.columns = ['developer_name', 'total_time_saved', 'total_estimates', 'copilot_count', 'total_entries']
                         
-                        for _, dev_row in developer_stats.iterrows():
-                            efficiency_rate = 0.0
-                            if dev_row['total_estimates'] > 0:
-                                efficiency_rate = (dev_row['total_time_saved'] / dev_row['total_estimates']) * 100
-                            
-                            copilot_rate = 0.0
-                            if dev_row['total_entries'] > 0:
-                                copilot_rate = (dev_row['copilot_count'] / dev_row['total_entries']) * 100
-                            
-                            developer_leaderboard.append({
-                                "developer_name": dev_row['developer_name'],
-                                "team_name": team_name,
-                                "total_time_saved": float(dev_row['total_time_saved']),
-                                "total_entries": int(dev_row['total_entries']),
-                                "efficiency_rate": efficiency_rate,
-                                "copilot_usage_rate": copilot_rate,
-                                "avg_hours_per_entry": float(dev_row['total_time_saved'] / dev_row['total_entries']) if dev_row['total_entries'] > 0 else 0.0
-                            })
+                        developer_leaderboard.extend(_build_leaderboard_rows(
+                            developer_stats, [team_name] * len(developer_stats)
+                        ))
                         
-                        print(f"✅ Team {team_name} - stats calculated successfully")
+                        logger.debug("✅ Team %s - stats calculated successfully", team_name)
                         
                     except Exception as calc_error:
-                        print(f"⚠️ Team {team_name} - stats calculation error: {str(calc_error)}")
+                        logger.warning("⚠️ Team %s - stats calculation error: %s", team_name, calc_error)
                         # Continue with other teams
                         continue
                         
                 else:
-                    print(f"📊 Team {team_name} - no data found")
+                    logger.debug("📊 Team %s - no data found", team_name)
                     
             except Exception as team_error:
-                print(f"❌ Error processing team {team_name}: {str(team_error)}")
+                logger.error("❌ Error processing team %s: %s", team_name, team_error)
                 # Continue with other teams instead of failing completely
                 continue
         
+        # Single concatenation instead of re-copying the accumulator for every team
+        combined_df = pd.concat(team_frames, ignore_index=True) if team_frames else pd.DataFrame()
+        
         # Sort developer leaderboard by total time saved (descending)
         developer_leaderboard.sort(key=lambda x: x['total_time_saved'], reverse=True)
         
@@ -163,11 +240,14 @@ async def get_admin_dashboard():
             try:
                 # Use the combined_df that was already built during team processing
                 if not combined_df.empty:
-                    print(f"🔍 Combined dataframe debug:")
-                    print(f"   Shape: {combined_df.shape}")
-                    print(f"   Columns: {list(combined_df.columns)}")
-                    print(f"   Developer_Name values: {combined_df['Developer_Name'].unique()}")
-                    print(f"   Sample rows: {combined_df.head().to_dict('records')}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "🔍 Combined dataframe: shape=%s columns=%s developers=%s sample=%s",
+                            combined_df.shape,
+                            combined_df.columns.tolist(),
+                            combined_df['Developer_Name'].unique(),
+                            combined_df.head().to_dict('records')
+                        )
                     
                     # Calculate total metrics
                     total_time_saved = float(combined_df['Efficiency_Gained_Hours'].fillna(0).sum())
@@ -180,7 +260,7 @@ async def get_admin_dashboard():
                     
                     # Calculate Copilot usage rate
                     copilot_usage_rate = float(
-                        (combined_df['Copilot_Used'].fillna('').str.lower() == 'yes').sum() / len(combined_df) * 100
+                        combined_df['Copilot_Yes'].sum() / len(combined_df) * 100
                     )
                     
                     developers_count = combined_df['Developer_Name'].fillna('Unknown').nunique()
@@ -189,38 +269,19 @@ async def get_admin_dashboard():
                     developer_stats = combined_df.groupby('Developer_Name').agg({
                         'Efficiency_Gained_Hours': 'sum',
                         'Original_Estimate_Hours': 'sum',
-                        'Copilot_Used': lambda x: (x.str.lower() == 'yes').sum(),
-                        'Story_ID': 'count'  # Total entries
+                        'Copilot_Yes': 'sum',
+                        'Story_ID': 'count',  # Total entries
+                        'Team_Name': 'first'  # Team the developer's first entry belongs to
                     }).reset_index()
                     
-                    developer_stats.columns = ['developer_name', 'total_time_saved', 'total_estimates', 'copilot_count', 'total_entries']
-                    
-                    # Clear existing leaderboard and rebuild from combined data
-                    developer_leaderboard = []
+                    developer_stats.columns = ['developer_name', 'total_time_saved', 'total_estimates', 'copilot_count', 'total_entries', 'team_name']
                     
-                    for _, dev_row in developer_stats.iterrows():
-                        efficiency_rate = 0.0
-                        if dev_row['total_estimates'] > 0:
-                            efficiency_rate = (dev_row['total_time_saved'] / dev_row['total_estimates']) * 100
-                        
-                        copilot_rate = 0.0
-                        if dev_row['total_entries'] > 0:
-                            copilot_rate = (dev_row['copilot_count'] / dev_row['total_entries']) * 100
-                        
-                        # Find team name for this developer
-                        dev_team = combined_df[combined_df['Developer_Name'] == dev_row['developer_name']]['Team_Name'].iloc[0] if not combined_df[combined_df['Developer_Name'] == dev_row['developer_name']].empty else 'Unknown'
-                        
-                        developer_leaderboard.append({
-                            "developer_name": dev_row['developer_name'],
-                            "team_name": str(dev_team),
-                            "total_time_saved": float(dev_row['total_time_saved']),
-                            "total_entries": int(dev_row['total_entries']),
-                            "efficiency_rate": efficiency_rate,
-                            "copilot_usage_rate": copilot_rate,
-                            "avg_hours_per_entry": float(dev_row['total_time_saved'] / dev_row['total_entries']) if dev_row['total_entries'] > 0 else 0.0
-                        })
+                    # Rebuild the leaderboard from combined data
+                    developer_leaderboard = _build_leaderboard_rows(
+                        developer_stats, developer_stats['team_name'].astype(str).tolist()
+                    )
                     
-                    print(f"📊 Developer leaderboard: {len(developer_leaderboard)} developers found")
+                    logger.debug("📊 Developer leaderboard: %d developers found", len(developer_leaderboard))
                     
                     # IMPORTANT: Only generate trends if we have REAL timestamp data
                     has_real_timestamps = False
@@ -241,83 +302,68 @@ async def get_admin_dashboard():
                                 has_real_timestamps = True
                                 
                                 # Group by month for monthly trends
-                                valid_dates_df['month'] = valid_dates_df[date_column].dt.to_period('M')
-                                monthly_data = valid_dates_df.groupby('month').agg({
+                                month = valid_dates_df[date_column].dt.to_period('M').rename('month')
+                                monthly_data = valid_dates_df.groupby(month).agg({
                                     'Efficiency_Gained_Hours': 'sum',
                                     'Original_Estimate_Hours': 'sum',
-                                    'Copilot_Used': lambda x: (x.str.lower() == 'yes').sum(),
+                                    'Copilot_Yes': 'sum',
                                     'Story_ID': 'count'
                                 }).reset_index()
                                 
-                                for _, month_row in monthly_data.iterrows():
-                                    month_str = str(month_row['month'])
-                                    efficiency_rate = 0.0
-                                    if month_row['Original_Estimate_Hours'] > 0:
-                                        efficiency_rate = (month_row['Efficiency_Gained_Hours'] / month_row['Original_Estimate_Hours']) * 100
-                                    
-                                    copilot_rate = 0.0
-                                    if month_row['Story_ID'] > 0:
-                                        copilot_rate = (month_row['Copilot_Used'] / month_row['Story_ID']) * 100
-                                    
-                                    monthly_trends.append({
-                                        "month": month_str,
-                                        "time_saved": round(float(month_row['Efficiency_Gained_Hours']), 1),
-                                        "entries": int(month_row['Story_ID']),
-                                        "efficiency_rate": round(efficiency_rate, 1),
-                                        "copilot_usage": round(copilot_rate, 1)
-                                    })
+                                monthly_trends.extend(_build_trend_rows(
+                                    monthly_data, "month", monthly_data['month'].astype(str)
+                                ))
                                 
                                 # Generate daily trends for last 30 days
                                 thirty_days_ago = pd.Timestamp.now() - pd.Timedelta(days=30)
                                 recent_df = valid_dates_df[valid_dates_df[date_column] >= thirty_days_ago]
                                 
                                 if not recent_df.empty:
-                                    recent_df['date'] = recent_df[date_column].dt.date
-                                    daily_data = recent_df.groupby('date').agg({
+                                    day = recent_df[date_column].dt.date.rename('date')
+                                    daily_data = recent_df.groupby(day).agg({
                                         'Efficiency_Gained_Hours': 'sum',
                                         'Original_Estimate_Hours': 'sum',
-                                        'Copilot_Used': lambda x: (x.str.lower() == 'yes').sum(),
+                                        'Copilot_Yes': 'sum',
                                         'Story_ID': 'count'
                                     }).reset_index()
                                     
-                                    for _, day_row in daily_data.iterrows():
-                                        efficiency_rate = 0.0
-                                        if day_row['Original_Estimate_Hours'] > 0:
-                                            efficiency_rate = (day_row['Efficiency_Gained_Hours'] / day_row['Original_Estimate_Hours']) * 100
-                                        
-                                        copilot_rate = 0.0
-                                        if day_row['Story_ID'] > 0:
-                                            copilot_rate = (day_row['Copilot_Used'] / day_row['Story_ID']) * 100
-                                        
-                                        daily_trends.append({
-                                            "date": day_row['date'].strftime("%Y-%m-%d"),
-                                            "time_saved": round(float(day_row['Efficiency_Gained_Hours']), 1),
-                                            "entries": int(day_row['Story_ID']),
-                                            "efficiency_rate": round(efficiency_rate, 1),
-                                            "copilot_usage": round(copilot_rate, 1)
-                                        })
+                                    daily_trends.extend(_build_trend_rows(
+                                        daily_data, "date", daily_data['date'].astype(str)
+                                    ))
                         except Exception as date_error:
-                            print(f"⚠️ Error processing date-based trends: {str(date_error)}")
+                            logger.warning("⚠️ Error processing date-based trends: %s", date_error)
                             has_real_timestamps = False
                     
                     # Safe category breakdown - only if we have real data
                     if 'Category' in combined_df.columns and total_entries > 0:
                         try:
-                            category_data = combined_df.groupby('Category').agg({
+                            category_data = combined_df.groupby('Category', observed=True).agg({
                                 'Efficiency_Gained_Hours': 'sum',
                                 'Original_Estimate_Hours': 'sum',
                                 'Story_ID': 'count'
                             }).reset_index()
                             
-                            for _, row in category_data.iterrows():
-                                category_breakdown.append({
-                                    "category": str(row['Category']),
-                                    "time_saved": float(row['Efficiency_Gained_Hours']),
-                                    "entries": int(row['Story_ID']),
-                                    "percentage": float(row['Efficiency_Gained_Hours'] / total_time_saved * 100) if total_time_saved > 0 else 0
-                                })
+                            category_time_saved = category_data['Efficiency_Gained_Hours'].to_numpy(dtype=float)
+                            percentages = (
+                                (category_time_saved / total_time_saved * 100).tolist()
+                                if total_time_saved > 0 else [0] * len(category_time_saved)
+                            )
+                            category_breakdown.extend(
+                                {
+                                    "category": category,
+                                    "time_saved": saved,
+                                    "entries": count,
+                                    "percentage": percentage
+                                }
+                                for category, saved, count, percentage in zip(
+                                    category_data['Category'].astype(str).tolist(),
+                                    category_time_saved.tolist(),
+                                    category_data['Story_ID'].tolist(),
+                                    percentages
+                                )
+                            )
                         except Exception as cat_error:
-                            print(f"⚠️ Category breakdown error: {str(cat_error)}")
+                            logger.warning("⚠️ Category breakdown error: %s", cat_error)
                     
                     # Efficiency trends by team - only if we have real data
                     for team_stat in team_stats:
@@ -329,13 +375,13 @@ async def get_admin_dashboard():
                                 "copilot_usage": team_stat["copilot_usage_rate"]
                             })
                     
-                    print(f"✅ Dashboard calculations completed - Real data: {has_real_timestamps}, Entries: {total_entries}")
+                    logger.debug("✅ Dashboard calculations completed - Real data: %s, Entries: %d", has_real_timestamps, total_entries)
                     
                 else:
-                    print("⚠️ No valid team data found for calculations")
+                    logger.info("⚠️ No valid team data found for calculations")
                     
             except Exception as calc_error:
-                print(f"❌ Error in dashboard calculations: {str(calc_error)}")
+                logger.error("❌ Error in dashboard calculations: %s", calc_error)
                 # Return basic stats even if trend calculations fail
                 total_time_saved = 0.0
                 total_entries = 0
@@ -344,7 +390,7 @@ async def get_admin_dashboard():
                 developers_count = 0
         
         else:
-            print("⚠️ No team stats available")
+            logger.info("⚠️ No team stats available")
             total_time_saved = 0.0
             total_entries = 0
             average_efficiency = 0.0
@@ -361,11 +407,12 @@ async def get_admin_dashboard():
         if developer_leaderboard:
             developer_leaderboard.sort(key=lambda x: x['total_time_saved'], reverse=True)
         
-        print(f"🔍 Final debug before return:")
-        print(f"   Developer leaderboard length: {len(developer_leaderboard)}")
-        print(f"   Developer leaderboard content: {developer_leaderboard}")
-        print(f"   Total entries: {total_entries}")
-        print(f"   Team stats: {len(team_stats)}")
+        logger.debug(
+            "🔍 Dashboard ready: leaderboard=%d entries=%d teams=%d",
+            len(developer_leaderboard), total_entries, len(team_stats)
+        )
+        
+        set_cache_headers(response, etag)
         
         # Return the response with proper data structure
         return {
@@ -393,8 +440,7 @@ async def get_admin_dashboard():
         }
         
     except Exception as e:
-        print(f"❌ Critical error in admin dashboard: {str(e)}")
-        print(f"   Exception type: {type(e).__name__}")
+        logger.error("❌ Critical error in admin dashboard: %s (%s)", e, type(e).__name__)
         # Return basic empty response instead of 500 error
         return {
             "total_time_saved": 0.0,
@@ -413,31 +459,39 @@ async def get_admin_dashboard():
 
 
 @router.get("/settings", response_model=TeamSettings)
-async def get_team_settings():
-    """Get team settings - Public for testing"""
+async def get_team_settings(token_data: dict = Depends(verify_admin_token)):
+    """Get team settings"""
     settings_manager = get_team_settings_manager_instance()
-    settings = settings_manager.load_team_settings()
+    settings = await run_in_threadpool(settings_manager.load_team_settings)
     
     return TeamSettings(**settings)
 
 
 @router.put("/settings", response_model=ApiResponse)
-async def update_team_settings(settings_data: UpdateSettingsRequest):
-    """Update team settings - Public for testing"""
+async def update_team_settings(
+    settings_data: UpdateSettingsRequest,
+    token_data: dict = Depends(verify_admin_token)
+):
+    """Update team settings"""
     settings_manager = get_team_settings_manager_instance()
-    current_settings = settings_manager.load_team_settings()
     
-    # Update only provided fields
-    if settings_data.categories is not None:
-        current_settings['categories'] = settings_data.categories
-    
-    if settings_data.efficiency_areas is not None:
-        current_settings['efficiency_areas'] = settings_data.efficiency_areas
-    
-    if settings_data.category_efficiency_mapping is not None:
-        current_settings['category_efficiency_mapping'] = settings_data.category_efficiency_mapping
+    # Held from load to save so concurrent edits don't overwrite each other's fields
+    async with team_settings_write_lock():
+        current_settings = await run_in_threadpool(settings_manager.load_team_settings)
+        
+        # Update only provided fields
+        if settings_data.categories is not None:
+            current_settings['categories'] = settings_data.categories
+        
+        if settings_data.efficiency_areas is not None:
+            current_settings['efficiency_areas'] = settings_data.efficiency_areas
+        
+        if settings_data.category_efficiency_mapping is not None:
+            current_settings['category_efficiency_mapping'] = settings_data.category_efficiency_mapping
+        
+        saved = await run_in_threadpool(settings_manager.save_team_settings, current_settings)
     
-    if settings_manager.save_team_settings(current_settings):
+    if saved:
         return ApiResponse(
             success=True,
             message="Team settings updated successfully"
@@ -450,12 +504,16 @@ async def update_team_settings(settings_data: UpdateSettingsRequest):
 
 
 @router.get("/teams/{team_name}/data")
-async def get_team_data(team_name: str):
-    """Get data for a specific team - Public for testing"""
+async def get_team_data(
+    team_name: str,
+    stats_only: bool = Query(False, description="Return only the aggregate stats, without entries"),
+    token_data: dict = Depends(verify_admin_token)
+):
+    """Get data for a specific team"""
     data_manager = get_data_manager_instance()
     teams_config_manager = get_teams_config_manager_instance()
     
-    teams_config = teams_config_manager.load_teams_config()
+    teams_config = await run_in_threadpool(teams_config_manager.load_teams_config)
     
     if team_name not in teams_config:
         raise HTTPException(
@@ -463,77 +521,66 @@ async def get_team_data(team_name: str):
             detail=f"Team '{team_name}' not found"
         )
     
-    df = data_manager.load_team_data(team_name)
+    df = await run_in_threadpool(data_manager.load_team_data, team_name, copy=False)
     
     if df.empty:
-        return {
-            "success": True,
-            "data": {
-                "entries": [],
-                "stats": {
-                    "total_time_saved": 0.0,
-                    "total_entries": 0,
-                    "average_efficiency": 0.0,
-                    "copilot_usage_rate": 0.0
-                }
+        data = {
+            "stats": {
+                "total_time_saved": 0.0,
+                "total_entries": 0,
+                "average_efficiency": 0.0,
+                "copilot_usage_rate": 0.0
             }
         }
+        if not stats_only:
+            data["entries"] = []
+        return {"success": True, "data": data}
     
-    # Convert dataframe to records for JSON serialization
-    entries = df.to_dict('records')
+    # Calculate stats with numpy masks (NaN-safe, no intermediate DataFrames)
+    time_saved = df['Efficiency_Gained_Hours'].to_numpy(dtype=float, na_value=np.nan)
+    estimates = df['Original_Estimate_Hours'].to_numpy(dtype=float, na_value=np.nan)
+    valid = estimates > 0
     
-    # Convert pandas data types to Python native types
-    for entry in entries:
-        for key, value in entry.items():
-            if pd.isna(value):
-                entry[key] = None
-            elif isinstance(value, (pd.Timestamp, pd.Period)):
-                entry[key] = str(value)
-            elif hasattr(value, 'item'):  # numpy types
-                entry[key] = value.item()
-    
-    # Calculate stats
-    total_time_saved = float(df['Efficiency_Gained_Hours'].sum())
+    total_time_saved = float(np.nansum(time_saved))
     total_entries = len(df)
     
-    valid_estimates = df[df['Original_Estimate_Hours'] > 0]
-    if not valid_estimates.empty:
-        average_efficiency = float(
-            (valid_estimates['Efficiency_Gained_Hours'].sum() / 
-             valid_estimates['Original_Estimate_Hours'].sum()) * 100
-        )
-    else:
-        average_efficiency = 0.0
+    estimate_total = np.nansum(estimates[valid])
+    average_efficiency = float(np.nansum(time_saved[valid]) / estimate_total * 100) if estimate_total > 0 else 0.0
+    
+    copilot_usage_rate = float(df['Copilot_Used'].eq('Yes').sum() / total_entries * 100)
+    
+    stats = {
+        "total_time_saved": total_time_saved,
+        "total_entries": total_entries,
+        "average_efficiency": average_efficiency,
+        "copilot_usage_rate": copilot_usage_rate
+    }
     
-    copilot_usage_rate = float(
-        (df['Copilot_Used'] == 'Yes').sum() / len(df) * 100
-    ) if len(df) > 0 else 0.0
+    if stats_only:
+        return {"success": True, "data": {"stats": stats}}
     
     return {
         "success": True,
         "data": {
-            "entries": entries,
-            "stats": {
-                "total_time_saved": total_time_saved,
-                "total_entries": total_entries,
-                "average_efficiency": average_efficiency,
-                "copilot_usage_rate": copilot_usage_rate
-            }
+            # Convert dataframe to JSON-safe records in one vectorized pass
+            "entries": dataframe_to_records(df),
+            "stats": stats
         }
     }
 
 
 @router.get("/debug/s3", response_model=ApiResponse)
-async def debug_s3_connection():
-    """Debug S3 connection and list bucket contents - Public for testing"""
+async def debug_s3_connection(token_data: dict = Depends(verify_admin_token)):
+    """Debug S3 connection and list bucket contents"""
     try:
         data_manager = get_data_manager_instance()
         
         # Test S3 connection
-        data_manager.s3_client.head_bucket(Bucket=data_manager.s3_bucket)
+        await run_in_threadpool(data_manager.s3_client.head_bucket, Bucket=data_manager.s3_bucket)
         
         # List all objects in the teams/ folder
-        response = data_manager.s3_client.list_objects_v2(
+        response = await run_in_threadpool(
+            data_manager.s3_client.list_objects_v2,
             Bucket=data_manager.s3_bucket,
             Prefix='teams/'
         )
@@ -557,7 +604,7 @@ async def debug_s3_connection():
             }
         }
     except Exception as e:
-        print(f"❌ S3 Debug Error: {str(e)}")
+        logger.error("❌ S3 Debug Error: %s", e)
         return {
             "success": False,
             "message": f"S3 connection failed: {str(e)}",
@@ -2,14 +2,51 @@
 Authentication router for admin and engineer login
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from datetime import timedelta
+from typing import Any
+import logging
 
 from models.schemas import LoginRequest, TokenResponse, EngineerLoginRequest, EmailLoginRequest, ApiResponse
-from core.auth import verify_admin_password, create_access_token, get_settings
-from core.database import get_teams_config_manager_instance
+from core.auth import (
+    verify_admin_password, verify_token, verify_password_async, hash_password_async, is_password_hash,
+    create_access_token, get_settings
+)
+from core.database import get_teams_config_manager_instance, normalize_developers, update_teams_config
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+def token_response(**fields: Any) -> ORJSONResponse:
+    """Build a TokenResponse and serialize it directly, skipping FastAPI's response_model re-validation"""
+    return ORJSONResponse(TokenResponse(**fields).model_dump())
+
+
+async def upgrade_legacy_password(team_name: str, developer_name: str, password: str):
+    """Replace a developer's plaintext password with a hash after a successful login"""
+    try:
+        password_hash = await hash_password_async(password)
+        upgraded = False
+        
+        def store_password_hash(teams_config):
+            nonlocal upgraded
+            for dev in normalize_developers(teams_config.get(team_name)):
+                if dev.get('name') == developer_name:
+                    stored_password = dev.get('password') or ''
+                    if stored_password and not is_password_hash(stored_password):
+                        dev['password'] = password_hash
+                        upgraded = True
+                    break
+        
+        # Goes through the shared config edit queue, so it can't overwrite a concurrent admin edit
+        await update_teams_config(store_password_hash)
+        if upgraded:
+            logger.info("🔐 Upgraded stored password for %s in %s", developer_name, team_name)
+    except Exception as e:
+        logger.warning("⚠️ Could not upgrade stored password for %s: %s", developer_name, e)
 
 
 @router.post("/admin/login", response_model=TokenResponse)
@@ -25,68 +62,47 @@ async def admin_login(login_data: LoginRequest):
         data={"user_type": "admin", "sub": "admin"}
     )
     
-    return TokenResponse(
+    return token_response(
         access_token=access_token,
         user_type="admin"
     )
 
 
 @router.post("/engineer/login", response_model=TokenResponse)
-async def engineer_login(login_data: EngineerLoginRequest):
+async def engineer_login(login_data: EngineerLoginRequest, background_tasks: BackgroundTasks):
     """Engineer login endpoint with password validation"""
     teams_config_manager = get_teams_config_manager_instance()
-    teams_config = teams_config_manager.load_teams_config()
+    team_developers = (await run_in_threadpool(teams_config_manager.get_name_index)).get(login_data.team_name)
     
     # Verify team exists
-    if login_data.team_name not in teams_config:
+    if team_developers is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid team name"
         )
     
-    team_config = teams_config[login_data.team_name]
-    
-    # Handle both old and new data structures
-    if isinstance(team_config, dict) and 'developers' in team_config:
-        developers = team_config['developers']
-    elif isinstance(team_config, list):
-        # Convert old format to new format for processing
-        developers = [{'name': dev} if isinstance(dev, str) else dev for dev in team_config]
-    else:
-        developers = []
-    
     # Find the developer and validate credentials
-    developer_found = False
-    password_valid = False
-    
-    for dev in developers:
-        if isinstance(dev, dict):
-            dev_name = dev.get('name', '')
-            dev_password = dev.get('password', '')
-        else:
-            dev_name = str(dev)
-            dev_password = ''
-        
-        if dev_name == login_data.developer_name:
-            developer_found = True
-            # If no password is set for the developer, allow any password
-            # If password is set, it must match
-            if not dev_password or dev_password == login_data.password:
-                password_valid = True
-            break
-    
-    if not developer_found:
+    dev = team_developers.get(login_data.developer_name)
+    if dev is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid developer name for this team"
         )
     
-    if not password_valid:
+    # If no password is set for the developer, allow any password
+    # If password is set, it must match
+    dev_password = dev.get('password') or ''
+    if dev_password and not await verify_password_async(dev_password, login_data.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid password"
         )
     
+    if dev_password and not is_password_hash(dev_password):
+        background_tasks.add_task(
+            upgrade_legacy_password, login_data.team_name, login_data.developer_name, login_data.password
+        )
+    
     access_token = create_access_token(
         data={
             "user_type": "engineer",
@@ -95,43 +111,28 @@ async def engineer_login(login_data: EngineerLoginRequest):
         }
     )
     
-    return TokenResponse(
+    return token_response(
         access_token=access_token,
         user_type="engineer"
     )
 
 
 @router.post("/engineer/login-email", response_model=TokenResponse)
-async def engineer_email_login(login_data: EmailLoginRequest):
+async def engineer_email_login(login_data: EmailLoginRequest, background_tasks: BackgroundTasks):
     """Engineer login endpoint using email and password"""
     teams_config_manager = get_teams_config_manager_instance()
-    teams_config = teams_config_manager.load_teams_config()
     
-    # Search for the developer by email across all teams
+    # Look up the developer by email across all teams
     found_developer = None
     found_team = None
     
-    for team_name, team_config in teams_config.items():
-        # Handle both old and new data structures
-        if isinstance(team_config, dict) and 'developers' in team_config:
-            developers = team_config['developers']
-        elif isinstance(team_config, list):
-            developers = [{'name': dev} if isinstance(dev, str) else dev for dev in team_config]
-        else:
-            developers = []
-        
-        for dev in developers:
-            if isinstance(dev, dict):
-                dev_email = dev.get('email', '')
-                dev_password = dev.get('password', '')
-                dev_name = dev.get('name', '')
-                
-                if dev_email == login_data.email:
-                    # Found the developer, now validate password
-                    if not dev_password or dev_password == login_data.password:
-                        found_developer = dev
-                        found_team = team_name
-                        break
+    email_index = await run_in_threadpool(teams_config_manager.get_email_index)
+    for team_name, dev in email_index.get(login_data.email.lower(), []):
+        dev_password = dev.get('password') or ''
+        if not dev_password or await verify_password_async(dev_password, login_data.password):
+            found_developer = dev
+            found_team = team_name
+            break
     
     if not found_developer:
         raise HTTPException(
@@ -139,6 +140,11 @@ async def engineer_email_login(login_data: EmailLoginRequest):
             detail="Invalid email or password"
         )
     
+    if dev_password and not is_password_hash(dev_password):
+        background_tasks.add_task(
+            upgrade_legacy_password, found_team, found_developer.get('name', ''), login_data.password
+        )
+    
     # Create access token with user data
     access_token = create_access_token(
         data={
@@ -150,7 +156,7 @@ async def engineer_email_login(login_data: EmailLoginRequest):
     )
     
     # Return response with user data
-    return TokenResponse(
+    return token_response(
         access_token=access_token,
         user_type="engineer",
         user_data={
@@ -164,7 +170,7 @@ async def engineer_email_login(login_data: EmailLoginRequest):
 
 
 @router.post("/verify", response_model=ApiResponse)
-async def verify_token_endpoint(token_data: dict = Depends(lambda: None)):
+async def verify_token_endpoint(token_data: dict = Depends(verify_token)):
     """Verify token endpoint"""
     return ApiResponse(
         success=True,
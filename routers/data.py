@@ -2,19 +2,284 @@
 Data management router for export and data operations
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse, ORJSONResponse, Response
 from typing import List, Optional, Dict, Any
 import pandas as pd
+import numpy as np
 import io
+import zipfile
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
 from models.schemas import ExportRequest, ApiResponse
 from core.auth import verify_admin_token
-from core.database import get_data_manager_instance, get_teams_config_manager_instance
+from core.database import (
+    get_data_manager_instance, get_teams_config_manager_instance, team_write_lock, yes_mask, ENTRY_ID_COLUMN
+)
+from core.serialization import (
+    ARROW_STREAM_MEDIA_TYPE, dataframe_to_arrow_stream, dataframe_to_records, iter_dataframe_csv, write_dataframe_xlsx
+)
+from core.http_cache import make_etag, etag_matches, set_cache_headers, not_modified_response
 
 router = APIRouter()
 
+EXPORT_CHUNK_SIZE = 64 * 1024
+MAX_ENTRIES_PAGE_SIZE = 1000
+
+# Columns read by the analytics builders
+ANALYTICS_COLUMNS = [
+    'Week', 'Team_Name', 'Developer_Name', 'Category', 'Copilot_Used',
+    'Original_Estimate_Hours', 'Efficiency_Gained_Hours'
+]
+
+# Analytics payloads keyed by the S3 version of the data they were computed from
+ANALYTICS_CACHE_SIZE = 128
+_analytics_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+
+def iter_buffer(buffer: io.BytesIO, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """Yield a buffer's contents in chunks, from the start"""
+    buffer.seek(0)
+    while True:
+        chunk = buffer.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def build_xlsx_buffer(df: pd.DataFrame, sheet_name: str) -> io.BytesIO:
+    """Write a DataFrame to an in-memory xlsx workbook"""
+    output = io.BytesIO()
+    write_dataframe_xlsx(df, output, sheet_name=sheet_name)
+    return output
+
+
+class ChunkSink:
+    """Write-only, non-seekable file object whose written bytes are drained by a generator"""
+    
+    def __init__(self):
+        self._chunks: List[bytes] = []
+    
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def flush(self) -> None:
+        pass
+    
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_team_export_zip(team_data: Dict[str, pd.DataFrame]):
+    """Yield a zip with one xlsx workbook per non-empty team, one team at a time"""
+    sink = ChunkSink()
+    
+    # zipfile falls back to streaming mode (data descriptors) on a non-seekable sink;
+    # xlsx files are already zip-compressed, so store them without deflating again
+    with zipfile.ZipFile(sink, 'w', zipfile.ZIP_STORED) as zip_file:
+        for team_name, df in team_data.items():
+            if not df.empty:
+                excel_buffer = build_xlsx_buffer(df, f'{team_name}_Data')
+                zip_file.writestr(f"{team_name}_efficiency_data.xlsx", excel_buffer.getbuffer())
+                del excel_buffer
+                yield sink.drain()
+    
+    # Central directory, written on close
+    yield sink.drain()
+
+
+def buffer_response(buffer: io.BytesIO, media_type: str, filename: str) -> StreamingResponse:
+    """Stream an in-memory export without copying it into a second buffer"""
+    return StreamingResponse(
+        iter_buffer(buffer),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Content-Length": str(buffer.getbuffer().nbytes),
+            # xlsx and zip are already compressed; tell GZipMiddleware to leave them alone
+            "Content-Encoding": "identity"
+        }
+    )
+
+
+def parse_date_range(start_date: Optional[str], end_date: Optional[str]) -> tuple:
+    """Parse optional YYYY-MM-DD bounds, rejecting malformed dates with a 400"""
+    try:
+        start_dt = datetime.strptime(start_date, '%Y-%m-%d') if start_date else None
+        end_dt = datetime.strptime(end_date, '%Y-%m-%d') if end_date else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid date format: {str(e)}"
+        )
+    return start_dt, end_dt
+
+
+def filter_by_week(df: pd.DataFrame, start_dt: Optional[datetime], end_dt: Optional[datetime]) -> pd.DataFrame:
+    """Return the rows whose Week falls within the optional bounds (Week is parsed to datetimes at load)"""
+    if start_dt is None and end_dt is None:
+        return df
+    
+    weeks = df['Week']
+    mask = pd.Series(True, index=df.index)
+    if start_dt is not None:
+        mask &= weeks >= start_dt
+    if end_dt is not None:
+        mask &= weeks <= end_dt
+    return df[mask]
+
+
+def get_cached_analytics(cache_key: tuple) -> Optional[Dict[str, Any]]:
+    """Return memoized analytics for a data version, if present"""
+    cached = _analytics_cache.get(cache_key)
+    if cached is not None:
+        _analytics_cache.move_to_end(cache_key)
+    return cached
+
+
+def cache_analytics(cache_key: tuple, analytics: Dict[str, Any]) -> None:
+    """Memoize analytics for a data version, evicting the least recently used entries"""
+    _analytics_cache[cache_key] = analytics
+    _analytics_cache.move_to_end(cache_key)
+    while len(_analytics_cache) > ANALYTICS_CACHE_SIZE:
+        _analytics_cache.popitem(last=False)
+
+
+def efficiency_rate(time_saved: float, estimate: float) -> float:
+    """Efficiency gained as a percentage of the original estimate (0 when there is no estimate)"""
+    return float(time_saved / estimate * 100) if estimate > 0 else 0.0
+
+
+def summarize_entries(df: pd.DataFrame) -> Dict[str, Any]:
+    """Scalar totals for a set of entries, each computed in one pass over a numpy column"""
+    time_saved = df['Efficiency_Gained_Hours'].to_numpy(dtype=float, na_value=np.nan)
+    estimates = df['Original_Estimate_Hours'].to_numpy(dtype=float, na_value=np.nan)
+    copilot_used = yes_mask(df['Copilot_Used'])
+    
+    total_entries = len(df)
+    valid = estimates > 0
+    
+    return {
+        "total_time_saved": float(np.nansum(time_saved)),
+        "total_entries": total_entries,
+        "average_efficiency": efficiency_rate(np.nansum(time_saved[valid]), np.nansum(estimates[valid])),
+        "copilot_usage_rate": float(copilot_used.sum() / total_entries * 100) if total_entries > 0 else 0.0,
+        "developers_count": int(df['Developer_Name'].nunique())
+    }
+
+
+def monthly_trend_rows(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Per-month time saved, entry count and efficiency rate"""
+    # Group by a derived key Series rather than assigning a Month column onto a copy of the frame
+    month = df['Week'].dt.to_period('M').rename('Month')
+    monthly = df.groupby(month).agg(
+        time_saved=('Efficiency_Gained_Hours', 'sum'),
+        estimate=('Original_Estimate_Hours', 'sum'),
+        entries=('Efficiency_Gained_Hours', 'size')
+    )
+    
+    return [
+        {
+            "month": str(month),
+            "time_saved": float(time_saved),
+            "entries": int(entries),
+            "efficiency_rate": efficiency_rate(time_saved, estimate)
+        }
+        for month, time_saved, estimate, entries in zip(
+            monthly.index, monthly['time_saved'], monthly['estimate'], monthly['entries']
+        )
+    ]
+
+
+def build_team_analytics(team_name: str, df: pd.DataFrame) -> Dict[str, Any]:
+    """Compute the team analytics payload from a (non-empty) team DataFrame"""
+    summary = summarize_entries(df)
+    
+    # Category breakdown
+    category_stats = df.groupby('Category', observed=True).agg(
+        time_saved=('Efficiency_Gained_Hours', 'sum'),
+        entries=('Developer_Name', 'count')
+    )
+    category_breakdown = [
+        {"category": category, "time_saved": float(time_saved), "entries": int(entries)}
+        for category, time_saved, entries in zip(
+            category_stats.index, category_stats['time_saved'], category_stats['entries']
+        )
+    ]
+    
+    # Developer stats
+    developer_stats = df.groupby('Developer_Name').agg(
+        time_saved=('Efficiency_Gained_Hours', 'sum'),
+        estimate=('Original_Estimate_Hours', 'sum'),
+        entries=('Efficiency_Gained_Hours', 'size')
+    )
+    developer_list = [
+        {
+            "developer_name": developer_name,
+            "time_saved": float(time_saved),
+            "entries": int(entries),
+            "efficiency_rate": efficiency_rate(time_saved, estimate)
+        }
+        for developer_name, time_saved, estimate, entries in zip(
+            developer_stats.index, developer_stats['time_saved'],
+            developer_stats['estimate'], developer_stats['entries']
+        )
+    ]
+    
+    return {
+        "team_name": team_name,
+        "total_time_saved": summary["total_time_saved"],
+        "total_entries": summary["total_entries"],
+        "average_efficiency": summary["average_efficiency"],
+        "copilot_usage_rate": summary["copilot_usage_rate"],
+        "developers_count": summary["developers_count"],
+        "monthly_trends": monthly_trend_rows(df),
+        "category_breakdown": category_breakdown,
+        "developer_stats": developer_list
+    }
+
+
+def build_overall_analytics(combined_df: pd.DataFrame, teams_count: int) -> Dict[str, Any]:
+    """Compute the overall analytics payload from all teams' (non-empty) combined data"""
+    summary = summarize_entries(combined_df)
+    
+    # Team breakdown
+    team_stats = combined_df.groupby('Team_Name', observed=True).agg(
+        time_saved=('Efficiency_Gained_Hours', 'sum'),
+        estimate=('Original_Estimate_Hours', 'sum'),
+        entries=('Developer_Name', 'count'),
+        developers_count=('Developer_Name', 'nunique')
+    )
+    team_breakdown = [
+        {
+            "team_name": team_name,
+            "time_saved": float(time_saved),
+            "entries": int(entries),
+            "developers_count": int(developers_count),
+            "efficiency_rate": efficiency_rate(time_saved, estimate)
+        }
+        for team_name, time_saved, estimate, entries, developers_count in zip(
+            team_stats.index, team_stats['time_saved'], team_stats['estimate'],
+            team_stats['entries'], team_stats['developers_count']
+        )
+    ]
+    
+    return {
+        "total_time_saved": summary["total_time_saved"],
+        "total_entries": summary["total_entries"],
+        "average_efficiency": summary["average_efficiency"],
+        "copilot_usage_rate": summary["copilot_usage_rate"],
+        "teams_count": teams_count,
+        "developers_count": summary["developers_count"],
+        "team_breakdown": team_breakdown,
+        "monthly_trends": monthly_trend_rows(combined_df)
+    }
+
 
 @router.post("/export")
 async def export_data(
@@ -25,7 +290,7 @@ async def export_data(
     data_manager = get_data_manager_instance()
     teams_config_manager = get_teams_config_manager_instance()
     
-    teams_config = teams_config_manager.load_teams_config()
+    teams_config = await run_in_threadpool(teams_config_manager.load_teams_config)
     
     # Validate team names
     invalid_teams = [team for team in export_request.teams if team not in teams_config]
@@ -36,58 +301,40 @@ async def export_data(
         )
     
     if export_request.export_type == "combined":
-        # Create combined export
-        combined_df = pd.DataFrame()
+        # Create combined export, loading teams concurrently and concatenating all team frames once
+        team_data = await run_in_threadpool(data_manager.load_teams_data, export_request.teams, copy=False)
+        frames = [df for df in team_data.values() if not df.empty]
         
-        for team_name in export_request.teams:
-            df = data_manager.load_team_data(team_name)
-            if not df.empty:
-                combined_df = pd.concat([combined_df, df], ignore_index=True)
-        
-        if combined_df.empty:
+        if not frames:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No data found for selected teams"
             )
         
-        # Create Excel file in memory
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            combined_df.to_excel(writer, sheet_name='Combined_Data', index=False)
+        # A single team needs no concat copy
+        combined_df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
         
-        output.seek(0)
+        # Create Excel file in memory, off the event loop
+        output = await run_in_threadpool(build_xlsx_buffer, combined_df, 'Combined_Data')
         
-        return StreamingResponse(
-            io.BytesIO(output.read()),
+        return buffer_response(
+            output,
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": "attachment; filename=combined_efficiency_data.xlsx"}
+            filename="combined_efficiency_data.xlsx"
         )
     
     else:
-        # Create individual team exports in a zip file
-        import zipfile
-        
-        zip_buffer = io.BytesIO()
-        
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for team_name in export_request.teams:
-                df = data_manager.load_team_data(team_name)
-                
-                if not df.empty:
-                    # Create Excel file for this team
-                    excel_buffer = io.BytesIO()
-                    with pd.ExcelWriter(excel_buffer, engine='xlsxwriter') as writer:
-                        df.to_excel(writer, sheet_name=f'{team_name}_Data', index=False)
-                    
-                    excel_buffer.seek(0)
-                    zip_file.writestr(f"{team_name}_efficiency_data.xlsx", excel_buffer.read())
-        
-        zip_buffer.seek(0)
+        # Stream individual team exports as a zip; loads run concurrently, and the sync
+        # generator (one workbook build per step) is iterated in the threadpool
+        team_data = await run_in_threadpool(data_manager.load_teams_data, export_request.teams, copy=False)
         
         return StreamingResponse(
-            io.BytesIO(zip_buffer.read()),
+            iter_team_export_zip(team_data),
             media_type="application/zip",
-            headers={"Content-Disposition": "attachment; filename=team_efficiency_data.zip"}
+            headers={
+                "Content-Disposition": "attachment; filename=team_efficiency_data.zip",
+                "Content-Encoding": "identity"
+            }
         )
 
 
@@ -101,7 +348,7 @@ async def delete_entry(
     data_manager = get_data_manager_instance()
     teams_config_manager = get_teams_config_manager_instance()
     
-    teams_config = teams_config_manager.load_teams_config()
+    teams_config = await run_in_threadpool(teams_config_manager.load_teams_config)
     
     if team_name not in teams_config:
         raise HTTPException(
@@ -109,18 +356,23 @@ async def delete_entry(
             detail=f"Team '{team_name}' not found"
         )
     
-    df = data_manager.load_team_data(team_name)
-    
-    if df.empty or entry_id >= len(df):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Entry not found"
-        )
-    
-    # Remove the entry
-    df = df.drop(df.index[entry_id]).reset_index(drop=True)
+    # Same per-team write lock as create_entry, so a concurrent insert can't resurrect the entry
+    async with team_write_lock(team_name):
+        df = await run_in_threadpool(data_manager.load_team_data, team_name, copy=False, revalidate=True)
+        
+        # Entries are addressed by their stable Entry_ID, not their row position
+        keep = df[ENTRY_ID_COLUMN].to_numpy() != entry_id if not df.empty else None
+        if keep is None or keep.all():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Entry not found"
+            )
+        
+        df = df[keep]
+        
+        saved = await run_in_threadpool(data_manager.save_team_data, team_name, df)
     
-    if data_manager.save_team_data(team_name, df):
+    if saved:
         return ApiResponse(
             success=True,
             message="Entry deleted successfully"
@@ -134,14 +386,17 @@ async def delete_entry(
 
 @router.get("/teams/{team_name}/entries")
 async def get_team_entries(
+    request: Request,
     team_name: str,
+    offset: int = Query(0, ge=0, description="Number of entries to skip"),
+    limit: int = Query(100, ge=1, le=MAX_ENTRIES_PAGE_SIZE, description="Maximum number of entries to return"),
     token_data: dict = Depends(verify_admin_token)
 ):
     """Get all entries for a team with pagination"""
     data_manager = get_data_manager_instance()
     teams_config_manager = get_teams_config_manager_instance()
     
-    teams_config = teams_config_manager.load_teams_config()
+    teams_config = await run_in_threadpool(teams_config_manager.load_teams_config)
     
     if team_name not in teams_config:
         raise HTTPException(
@@ -149,36 +404,56 @@ async def get_team_entries(
             detail=f"Team '{team_name}' not found"
         )
     
-    df = data_manager.load_team_data(team_name)
+    # Clients that ask for Arrow get the page as an IPC stream instead of JSON records
+    as_arrow = ARROW_STREAM_MEDIA_TYPE in request.headers.get("accept", "")
+    
+    # Version the page by the team file's S3 ETag so unchanged data can be answered with a 304
+    data_etag = await run_in_threadpool(data_manager.get_team_data_etag, team_name)
+    etag_scope = "team-entries-arrow" if as_arrow else "team-entries"
+    etag = make_etag(etag_scope, team_name, data_etag, offset, limit) if data_etag else None
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+    
+    df = await run_in_threadpool(data_manager.load_team_data, team_name, copy=False)
+    
+    if as_arrow:
+        # Encoded in the threadpool, like the JSON path's load, to keep the event loop free
+        body = await run_in_threadpool(dataframe_to_arrow_stream, df.iloc[offset:offset + limit])
+        response = Response(
+            body,
+            media_type=ARROW_STREAM_MEDIA_TYPE,
+            headers={"X-Total-Count": str(len(df)), "Vary": "Accept"}
+        )
+        set_cache_headers(response, etag)
+        return response
     
     if df.empty:
         return {
             "success": True,
             "data": {
                 "entries": [],
-                "total": 0
+                "total": 0,
+                "offset": offset,
+                "limit": limit
             }
         }
     
-    # Convert to records and handle data types
-    entries = df.to_dict('records')
-    
-    for entry in entries:
-        for key, value in entry.items():
-            if pd.isna(value):
-                entry[key] = None
-            elif isinstance(value, (pd.Timestamp, pd.Period)):
-                entry[key] = str(value)
-            elif hasattr(value, 'item'):
-                entry[key] = value.item()
+    # Slice before converting so the work scales with the page, not the table
+    entries = dataframe_to_records(df.iloc[offset:offset + limit])
     
-    return {
+    # Records are already JSON-native; return the response directly to skip jsonable_encoder
+    response = ORJSONResponse({
         "success": True,
         "data": {
             "entries": entries,
-            "total": len(entries)
+            "total": len(df),
+            "offset": offset,
+            "limit": limit
         }
-    }
+    })
+    response.headers["Vary"] = "Accept"
+    set_cache_headers(response, etag)
+    return response
 
 
 @router.get("/analytics/team/{team_name}")
@@ -192,7 +467,7 @@ async def get_team_analytics(
     data_manager = get_data_manager_instance()
     teams_config_manager = get_teams_config_manager_instance()
     
-    teams_config = teams_config_manager.load_teams_config()
+    teams_config = await run_in_threadpool(teams_config_manager.load_teams_config)
     
     if team_name not in teams_config:
         raise HTTPException(
@@ -200,8 +475,20 @@ async def get_team_analytics(
             detail=f"Team '{team_name}' not found"
         )
     
-    # Load team data
-    df = data_manager.load_team_data(team_name)
+    # Unfiltered analytics only change when the team file does; serve them from memory per S3 version
+    cache_key = None
+    if not (start_date or end_date):
+        data_etag = await run_in_threadpool(data_manager.get_team_data_etag, team_name)
+        if data_etag:
+            cache_key = ("team", team_name, data_etag)
+            cached = get_cached_analytics(cache_key)
+            if cached is not None:
+                return {"success": True, "data": cached}
+    
+    start_dt, end_dt = parse_date_range(start_date, end_date)
+    
+    # Load team data; filtering and analytics never modify the cached frame
+    df = await run_in_threadpool(data_manager.load_team_data, team_name, copy=False)
     
     if df.empty:
         return {
@@ -221,105 +508,15 @@ async def get_team_analytics(
     
     # Filter by date range if provided
     if start_date or end_date:
-        try:
-            df['Week'] = pd.to_datetime(df['Week'])
-            if start_date:
-                start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-                df = df[df['Week'] >= start_dt]
-            if end_date:
-                end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-                df = df[df['Week'] <= end_dt]
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid date format: {str(e)}"
-            )
-    
-    # Calculate basic stats
-    total_time_saved = float(df['Efficiency_Gained_Hours'].sum())
-    total_entries = len(df)
-    
-    # Calculate average efficiency
-    valid_estimates = df[df['Original_Estimate_Hours'] > 0]
-    if not valid_estimates.empty:
-        average_efficiency = float(
-            (valid_estimates['Efficiency_Gained_Hours'].sum() / 
-             valid_estimates['Original_Estimate_Hours'].sum()) * 100
-        )
-    else:
-        average_efficiency = 0.0
-    
-    # Calculate Copilot usage rate
-    copilot_yes = len(df[df['Copilot_Used'].str.upper() == 'YES'])
-    copilot_usage_rate = (copilot_yes / total_entries * 100) if total_entries > 0 else 0.0
-    
-    # Developer count
-    developers_count = df['Developer_Name'].nunique()
-    
-    # Monthly trends
-    df_copy = df.copy()
-    df_copy['Month'] = pd.to_datetime(df_copy['Week']).dt.to_period('M')
-    monthly_stats = df_copy.groupby('Month').agg({
-        'Efficiency_Gained_Hours': 'sum',
-        'Original_Estimate_Hours': 'sum',
-        'Developer_Name': 'count'
-    }).reset_index()
-    
-    monthly_trends = []
-    for _, row in monthly_stats.iterrows():
-        efficiency_rate = (row['Efficiency_Gained_Hours'] / row['Original_Estimate_Hours'] * 100) if row['Original_Estimate_Hours'] > 0 else 0
-        monthly_trends.append({
-            "month": str(row['Month']),
-            "time_saved": float(row['Efficiency_Gained_Hours']),
-            "entries": int(row['Developer_Name']),
-            "efficiency_rate": float(efficiency_rate)
-        })
+        df = filter_by_week(df, start_dt, end_dt)
     
-    # Category breakdown
-    category_stats = df.groupby('Category').agg({
-        'Efficiency_Gained_Hours': 'sum',
-        'Developer_Name': 'count'
-    }).reset_index()
-    
-    category_breakdown = []
-    for _, row in category_stats.iterrows():
-        category_breakdown.append({
-            "category": row['Category'],
-            "time_saved": float(row['Efficiency_Gained_Hours']),
-            "entries": int(row['Developer_Name'])
-        })
-    
-    # Developer stats
-    developer_stats = df.groupby('Developer_Name').agg({
-        'Efficiency_Gained_Hours': 'sum',
-        'Original_Estimate_Hours': 'sum',
-        'Developer_Name': 'count'
-    }).reset_index()
-    developer_stats.columns = ['Developer_Name', 'Efficiency_Gained_Hours', 'Original_Estimate_Hours', 'Entries']
-    
-    developer_list = []
-    for _, row in developer_stats.iterrows():
-        efficiency_rate = (row['Efficiency_Gained_Hours'] / row['Original_Estimate_Hours'] * 100) if row['Original_Estimate_Hours'] > 0 else 0
-        developer_list.append({
-            "developer_name": row['Developer_Name'],
-            "time_saved": float(row['Efficiency_Gained_Hours']),
-            "entries": int(row['Entries']),
-            "efficiency_rate": float(efficiency_rate)
-        })
+    analytics = build_team_analytics(team_name, df)
+    if cache_key is not None:
+        cache_analytics(cache_key, analytics)
     
     return {
         "success": True,
-        "data": {
-            "team_name": team_name,
-            "total_time_saved": total_time_saved,
-            "total_entries": total_entries,
-            "average_efficiency": average_efficiency,
-            "copilot_usage_rate": copilot_usage_rate,
-            "developers_count": developers_count,
-            "monthly_trends": monthly_trends,
-            "category_breakdown": category_breakdown,
-            "developer_stats": developer_list
-        }
+        "data": analytics
     }
 
 
@@ -333,15 +530,31 @@ async def get_overall_analytics(
     data_manager = get_data_manager_instance()
     teams_config_manager = get_teams_config_manager_instance()
     
-    teams_config = teams_config_manager.load_teams_config()
-    
-    # Combine data from all teams
-    combined_df = pd.DataFrame()
-    
-    for team_name in teams_config.keys():
-        df = data_manager.load_team_data(team_name)
+    teams_config = await run_in_threadpool(teams_config_manager.load_teams_config)
+    
+    # Unfiltered analytics only change when team files or the team list do
+    cache_key = None
+    if not (start_date or end_date):
+        fingerprint = await run_in_threadpool(data_manager.get_objects_fingerprint, "teams/")
+        if fingerprint:
+            cache_key = ("overall", fingerprint, tuple(teams_config.keys()))
+            cached = get_cached_analytics(cache_key)
+            if cached is not None:
+                return {"success": True, "data": cached}
+    
+    start_dt, end_dt = parse_date_range(start_date, end_date)
+    
+    # Project and date-filter each team before combining so concat only copies rows that are used.
+    # Teams load concurrently; waiting on them happens in the threadpool so the event loop stays free.
+    team_data = await run_in_threadpool(data_manager.load_teams_data, list(teams_config.keys()), copy=False)
+    frames = []
+    for df in team_data.values():
         if not df.empty:
-            combined_df = pd.concat([combined_df, df], ignore_index=True)
+            df = df[[column for column in ANALYTICS_COLUMNS if column in df.columns]]
+            if start_date or end_date:
+                df = filter_by_week(df, start_dt, end_dt)
+            frames.append(df)
+    combined_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
     
     if combined_df.empty:
         return {
@@ -358,98 +571,19 @@ async def get_overall_analytics(
             }
         }
     
-    # Filter by date range if provided
-    if start_date or end_date:
-        try:
-            combined_df['Week'] = pd.to_datetime(combined_df['Week'])
-            if start_date:
-                start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-                combined_df = combined_df[combined_df['Week'] >= start_dt]
-            if end_date:
-                end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-                combined_df = combined_df[combined_df['Week'] <= end_dt]
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid date format: {str(e)}"
-            )
-    
-    # Calculate overall stats
-    total_time_saved = float(combined_df['Efficiency_Gained_Hours'].sum())
-    total_entries = len(combined_df)
-    
-    # Calculate average efficiency
-    valid_estimates = combined_df[combined_df['Original_Estimate_Hours'] > 0]
-    if not valid_estimates.empty:
-        average_efficiency = float(
-            (valid_estimates['Efficiency_Gained_Hours'].sum() / 
-             valid_estimates['Original_Estimate_Hours'].sum()) * 100
-        )
-    else:
-        average_efficiency = 0.0
-    
-    # Calculate Copilot usage rate
-    copilot_yes = len(combined_df[combined_df['Copilot_Used'].str.upper() == 'YES'])
-    copilot_usage_rate = (copilot_yes / total_entries * 100) if total_entries > 0 else 0.0
-    
-    # Teams and developers count
-    teams_count = len(teams_config)
-    developers_count = combined_df['Developer_Name'].nunique()
-    
-    # Team breakdown
-    team_stats = combined_df.groupby('Team_Name').agg({
-        'Efficiency_Gained_Hours': 'sum',
-        'Original_Estimate_Hours': 'sum',
-        'Developer_Name': ['count', 'nunique']
-    }).reset_index()
-    
-    team_breakdown = []
-    for _, row in team_stats.iterrows():
-        efficiency_rate = (row[('Efficiency_Gained_Hours', 'sum')] / row[('Original_Estimate_Hours', 'sum')] * 100) if row[('Original_Estimate_Hours', 'sum')] > 0 else 0
-        team_breakdown.append({
-            "team_name": row['Team_Name'],
-            "time_saved": float(row[('Efficiency_Gained_Hours', 'sum')]),
-            "entries": int(row[('Developer_Name', 'count')]),
-            "developers_count": int(row[('Developer_Name', 'nunique')]),
-            "efficiency_rate": float(efficiency_rate)
-        })
-    
-    # Monthly trends
-    df_copy = combined_df.copy()
-    df_copy['Month'] = pd.to_datetime(df_copy['Week']).dt.to_period('M')
-    monthly_stats = df_copy.groupby('Month').agg({
-        'Efficiency_Gained_Hours': 'sum',
-        'Original_Estimate_Hours': 'sum',
-        'Developer_Name': 'count'
-    }).reset_index()
-    
-    monthly_trends = []
-    for _, row in monthly_stats.iterrows():
-        efficiency_rate = (row['Efficiency_Gained_Hours'] / row['Original_Estimate_Hours'] * 100) if row['Original_Estimate_Hours'] > 0 else 0
-        monthly_trends.append({
-            "month": str(row['Month']),
-            "time_saved": float(row['Efficiency_Gained_Hours']),
-            "entries": int(row['Developer_Name']),
-            "efficiency_rate": float(efficiency_rate)
-        })
+    analytics = build_overall_analytics(combined_df, len(teams_config))
+    if cache_key is not None:
+        cache_analytics(cache_key, analytics)
     
     return {
         "success": True,
-        "data": {
-            "total_time_saved": total_time_saved,
-            "total_entries": total_entries,
-            "average_efficiency": average_efficiency,
-            "copilot_usage_rate": copilot_usage_rate,
-            "teams_count": teams_count,
-            "developers_count": developers_count,
-            "team_breakdown": team_breakdown,
-            "monthly_trends": monthly_trends
-        }
+        "data": analytics
     }
 
 
 @router.get("/export/team/{team_name}")
 async def export_team_data(
+    request: Request,
     team_name: str,
     format: str = Query("excel", description="Export format: excel or csv"),
     token_data: dict = Depends(verify_admin_token)
@@ -458,7 +592,7 @@ async def export_team_data(
     data_manager = get_data_manager_instance()
     teams_config_manager = get_teams_config_manager_instance()
     
-    teams_config = teams_config_manager.load_teams_config()
+    teams_config = await run_in_threadpool(teams_config_manager.load_teams_config)
     
     if team_name not in teams_config:
         raise HTTPException(
@@ -466,7 +600,12 @@ async def export_team_data(
             detail=f"Team '{team_name}' not found"
         )
     
-    df = data_manager.load_team_data(team_name)
+    data_etag = await run_in_threadpool(data_manager.get_team_data_etag, team_name)
+    etag = make_etag("team-export", team_name, data_etag, format.lower()) if data_etag else None
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+    
+    df = await run_in_threadpool(data_manager.load_team_data, team_name, copy=False)
     
     if df.empty:
         raise HTTPException(
@@ -475,30 +614,26 @@ async def export_team_data(
         )
     
     if format.lower() == "excel":
-        # Create Excel file in memory
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            df.to_excel(writer, sheet_name=f'{team_name}_Data', index=False)
-        
-        output.seek(0)
+        # Create Excel file in memory, off the event loop
+        output = await run_in_threadpool(build_xlsx_buffer, df, f'{team_name}_Data')
         
-        return StreamingResponse(
-            io.BytesIO(output.read()),
+        response = buffer_response(
+            output,
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename={team_name}_efficiency_data.xlsx"}
+            filename=f"{team_name}_efficiency_data.xlsx"
         )
+        set_cache_headers(response, etag)
+        return response
     
     elif format.lower() == "csv":
-        # Create CSV file in memory
-        output = io.StringIO()
-        df.to_csv(output, index=False)
-        csv_content = output.getvalue()
-        
-        return StreamingResponse(
-            io.StringIO(csv_content),
+        # Stream CSV in row chunks instead of building the whole file first
+        response = StreamingResponse(
+            iter_dataframe_csv(df),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={team_name}_efficiency_data.csv"}
         )
+        set_cache_headers(response, etag)
+        return response
     
     else:
         raise HTTPException(
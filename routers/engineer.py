@@ -3,19 +3,67 @@ Engineer router for data entry and dashboard - Public access for testing
 """
 
 from fastapi import APIRouter, HTTPException, status, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from collections import OrderedDict
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from models.schemas import CreateEntryRequest, ApiResponse, EngineerStats, EntriesResponse
-from core.database import get_data_manager_instance, get_team_settings_manager_instance
+from core.database import (
+    get_data_manager_instance, get_team_settings_manager_instance, run_shielded, team_write_lock, ENTRY_ID_COLUMN
+)
+from core.serialization import dataframe_to_records
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+RECENT_ENTRIES_COUNT = 10
+WEEK_DATES_CACHE_SIZE = 512
+
+# Column layout of a new entry row with the fixed defaults filled in; create_entry
+# copies it and sets the per-request fields, which keeps the column order stable
+ENTRY_TEMPLATE: Dict[str, Any] = {
+    ENTRY_ID_COLUMN: None,
+    'Week': None,
+    'Week_End': None,
+    'Story_ID': None,
+    'Developer_Name': None,
+    'Team_Name': None,
+    'Technology': 'General',  # Default value
+    'Original_Estimate_Hours': None,
+    'Efficiency_Gained_Hours': None,
+    'Category': None,
+    'Area_of_Efficiency': None,
+    'Copilot_Used': None,
+    'Task_Type': 'General',  # Default value
+    'Completion_Type': None,
+    'Lines_of_Code_Saved': None,
+    'Subjective_Ease_Rating': None,
+    'Review_Time_Saved_Hours': None,
+    'Bugs_Prevented': None,
+    'PR_Merged_Status': None,
+    'Notes': None,
+    'Timestamp': None
+}
+
+# Rows waiting for their team's next save: team_name -> [(entry, future resolved with the save result)]
+_pending_entries: Dict[str, List[Tuple[Dict[str, Any], "asyncio.Future[bool]"]]] = {}
+
+# Per-team developer views: team_name -> (team frame they were built from, {developer: view})
+DEVELOPER_INDEX_CACHE_SIZE = 64
+_developer_index_cache: "OrderedDict[str, tuple]" = OrderedDict()
 
 
 def get_week_dates(date_input):
     """Get Monday and Sunday for the week containing the given date"""
     if isinstance(date_input, str):
-        date_input = datetime.strptime(date_input, '%Y-%m-%d').date()
+        return _week_dates_from_str(date_input)
     
     # Find Monday of the week
     days_since_monday = date_input.weekday()
@@ -25,6 +73,135 @@ def get_week_dates(date_input):
     return monday, sunday
 
 
+@lru_cache(maxsize=WEEK_DATES_CACHE_SIZE)
+def _week_dates_from_str(date_str: str) -> Tuple[date, date]:
+    """Week bounds for a YYYY-MM-DD string; the same week dates recur across requests, so skip strptime"""
+    return get_week_dates(datetime.strptime(date_str, '%Y-%m-%d').date())
+
+
+def require_developer_and_team(developer_name: str, team_name: str) -> None:
+    """Reject requests missing the developer or team query parameter"""
+    if not developer_name or not team_name:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Missing developer name or team. Developer: {developer_name}, Team: {team_name}"
+        )
+
+
+def build_developer_index(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """Per-developer totals and row positions for a team frame, from a single groupby pass"""
+    time_saved = df['Efficiency_Gained_Hours'].to_numpy(dtype=float, na_value=np.nan)
+    estimates = df['Original_Estimate_Hours'].to_numpy(dtype=float, na_value=np.nan)
+    valid = estimates > 0
+    
+    grouped = pd.DataFrame({
+        'time_saved': time_saved,
+        'valid_time_saved': np.where(valid, time_saved, np.nan),
+        'valid_estimate': np.where(valid, estimates, np.nan)
+    }).groupby(df['Developer_Name'].to_numpy(dtype=object, na_value=None), dropna=True)
+    totals = grouped.sum()
+    
+    return {
+        developer_name: {
+            "total_time_saved": float(totals.at[developer_name, 'time_saved']),
+            "valid_time_saved": float(totals.at[developer_name, 'valid_time_saved']),
+            "valid_estimate": float(totals.at[developer_name, 'valid_estimate']),
+            "positions": positions
+        }
+        for developer_name, positions in grouped.indices.items()
+    }
+
+
+def get_developer_index(team_name: str, df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """Developer views for a team, rebuilt only when the cached team frame is replaced"""
+    cached = _developer_index_cache.get(team_name)
+    if cached is not None and cached[0] is df:
+        _developer_index_cache.move_to_end(team_name)
+        return cached[1]
+    
+    index = build_developer_index(df)
+    _developer_index_cache[team_name] = (df, index)
+    _developer_index_cache.move_to_end(team_name)
+    while len(_developer_index_cache) > DEVELOPER_INDEX_CACHE_SIZE:
+        _developer_index_cache.popitem(last=False)
+    return index
+
+
+def engineer_stats_response(
+    developer_name: str,
+    team_name: str,
+    total_time_saved: float = 0.0,
+    total_entries: int = 0,
+    average_efficiency: float = 0.0,
+    recent_entries: Optional[List[Dict[str, Any]]] = None
+) -> ORJSONResponse:
+    """Build an EngineerStats response directly; the values are already JSON-native, so skip jsonable_encoder"""
+    return ORJSONResponse({
+        "developer_name": developer_name,
+        "team_name": team_name,
+        "total_time_saved": total_time_saved,
+        "total_entries": total_entries,
+        "average_efficiency": average_efficiency,
+        "recent_entries": recent_entries or []
+    })
+
+
+async def append_team_entry(data_manager, team_name: str, new_entry: Dict[str, Any]) -> bool:
+    """Append a row to a team's data, saving it with any other rows queued for the team in one load-save cycle"""
+    saved = asyncio.get_running_loop().create_future()
+    _pending_entries.setdefault(team_name, []).append((new_entry, saved))
+    
+    # The flush runs shielded, so a cancelled request can't abandon a batch whose save is underway
+    await run_shielded(flush_team_entries(data_manager, team_name))
+    return await saved
+
+
+async def flush_team_entries(data_manager, team_name: str) -> None:
+    """Save all queued rows for a team in one load-save cycle and resolve their waiters"""
+    # Hold the team's write lock from load to save so concurrent writes are not lost; whoever
+    # takes it first saves every queued row, and later holders find their entry already written
+    async with team_write_lock(team_name):
+        batch = _pending_entries.pop(team_name, [])
+        if batch:
+            await _save_team_entries(data_manager, team_name, batch)
+
+
+async def _save_team_entries(data_manager, team_name: str, batch: List[tuple]) -> None:
+    """Append a batch of queued rows in one load-save cycle and resolve each waiter with the save result"""
+    try:
+        logger.debug("📂 Loading team data for: %s", team_name)
+        try:
+            df = await run_in_threadpool(data_manager.load_team_data, team_name, copy=False, revalidate=True)
+            logger.debug("📊 Loaded %d existing entries", len(df))
+        except Exception as load_error:
+            logger.error("❌ Error loading team data: %s (%s)", load_error, type(load_error).__name__)
+            raise load_error
+        
+        # Number the new rows after the current highest Entry_ID
+        next_entry_id = int(df[ENTRY_ID_COLUMN].max()) + 1 if not df.empty else 0
+        for offset, (entry, _) in enumerate(batch):
+            entry[ENTRY_ID_COLUMN] = next_entry_id + offset
+        new_rows = pd.DataFrame([entry for entry, _ in batch])
+        
+        # Add new entries to dataframe
+        if df.empty:
+            df = new_rows
+        else:
+            df = pd.concat([df, new_rows], ignore_index=True)
+        
+        logger.debug("💾 Saving %d entries to S3 (%d new)...", len(df), len(batch))
+        
+        # Save data; S3 calls and the workbook build run in the threadpool, off the event loop
+        save_result = await run_in_threadpool(data_manager.save_team_data, team_name, df)
+    except Exception as e:
+        for _, saved in batch:
+            saved.set_exception(e)
+        return
+    
+    for _, saved in batch:
+        saved.set_result(save_result)
+
+
 @router.post("/entry", response_model=ApiResponse)
 async def create_entry(
     entry_data: CreateEntryRequest,
@@ -35,77 +212,50 @@ async def create_entry(
     try:
         data_manager = get_data_manager_instance()
         
-        print(f"🔄 Creating entry for developer: {developer_name}, team: {team_name}")
+        logger.debug("🔄 Creating entry for developer: %s, team: %s", developer_name, team_name)
         
-        if not developer_name or not team_name:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Missing developer name or team. Developer: {developer_name}, Team: {team_name}"
-            )
+        require_developer_and_team(developer_name, team_name)
         
         # Get week dates
         selected_monday, selected_sunday = get_week_dates(entry_data.week_date)
-        print(f"📅 Week dates: {selected_monday} to {selected_sunday}")
-        
-        # Load existing data
-        print(f"📂 Loading team data for: {team_name}")
-        try:
-            df = data_manager.load_team_data(team_name)
-            print(f"📊 Loaded {len(df)} existing entries")
-        except Exception as load_error:
-            print(f"❌ Error loading team data: {str(load_error)}")
-            print(f"   Load error type: {type(load_error).__name__}")
-            raise load_error
+        logger.debug("📅 Week dates: %s to %s", selected_monday, selected_sunday)
         
-        # Create new entry
-        new_entry = {
-            'Week': selected_monday.strftime('%Y-%m-%d'),
-            'Week_End': selected_sunday.strftime('%Y-%m-%d'),
+        # Create new entry from the preset column template; its Entry_ID is assigned when the batch is saved
+        new_entry = ENTRY_TEMPLATE.copy()
+        new_entry.update({
+            'Week': pd.Timestamp(selected_monday),
+            'Week_End': pd.Timestamp(selected_sunday),
             'Story_ID': entry_data.story_id,
             'Developer_Name': developer_name,
             'Team_Name': team_name,
-            'Technology': 'General',  # Default value
             'Original_Estimate_Hours': entry_data.original_estimate,
             'Efficiency_Gained_Hours': entry_data.efficiency_gained,
             'Category': entry_data.category,
             'Area_of_Efficiency': ', '.join(entry_data.efficiency_areas),
             'Copilot_Used': entry_data.copilot_used,
-            'Task_Type': 'General',  # Default value
             'Completion_Type': 'Inline Suggestion' if entry_data.copilot_used == 'Yes' else 'Manual',
-            'Lines_of_Code_Saved': None,
-            'Subjective_Ease_Rating': None,
-            'Review_Time_Saved_Hours': None,
-            'Bugs_Prevented': None,
-            'PR_Merged_Status': None,
             'Notes': entry_data.notes or '',
-            'Timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
+            'Timestamp': datetime.now().isoformat(sep=' ', timespec='seconds')
+        })
         
         # Add calculated fields
         efficiency_percentage = (entry_data.efficiency_gained / entry_data.original_estimate) * 100 if entry_data.original_estimate > 0 else 0
         new_entry['Efficiency_Percentage'] = efficiency_percentage
         
-        print(f"📝 Created new entry: {new_entry['Story_ID']}")
-        
-        # Add new entry to dataframe
-        if df.empty:
-            df = pd.DataFrame([new_entry])
-        else:
-            df = pd.concat([df, pd.DataFrame([new_entry])], ignore_index=True)
-        
-        print(f"💾 Saving {len(df)} entries to S3...")
+        logger.debug("📝 Created new entry: %s", new_entry['Story_ID'])
         
-        # Save data
-        save_result = data_manager.save_team_data(team_name, df)
+        # Queue the row; entries queued for the team while a save is in flight go out together in the next one
+        save_result = await append_team_entry(data_manager, team_name, new_entry)
         
         if save_result:
-            print(f"✅ Successfully saved entry for {developer_name}")
-            return ApiResponse(
+            logger.debug("✅ Successfully saved entry for %s", developer_name)
+            # Returning a response skips FastAPI's response_model re-validation and jsonable_encoder pass
+            return ORJSONResponse(ApiResponse(
                 success=True,
                 message="Entry created successfully"
-            )
+            ).model_dump())
         else:
-            print(f"❌ Failed to save entry for {developer_name}")
+            logger.error("❌ Failed to save entry for %s", developer_name)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to save entry"
@@ -115,8 +265,7 @@ async def create_entry(
         # Re-raise HTTP exceptions as-is
         raise
     except Exception as e:
-        print(f"❌ Unexpected error creating entry: {str(e)}")
-        print(f"   Error type: {type(e).__name__}")
+        logger.error("❌ Unexpected error creating entry: %s (%s)", e, type(e).__name__)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Unexpected error creating entry: {str(e)}"
@@ -131,80 +280,51 @@ async def get_engineer_dashboard(
     """Get engineer dashboard data - no authentication required for testing"""
     data_manager = get_data_manager_instance()
     
-    print(f"🔍 Getting dashboard for developer: {developer_name}, team: {team_name}")
+    logger.debug("🔍 Getting dashboard for developer: %s, team: %s", developer_name, team_name)
     
     # Load engineer's data
     try:
-        df = data_manager.load_team_data(team_name)
-        print(f"📊 Loaded {len(df)} total entries for team {team_name}")
+        df = await run_in_threadpool(data_manager.load_team_data, team_name, copy=False)
+        logger.debug("📊 Loaded %d total entries for team %s", len(df), team_name)
     except Exception as e:
-        print(f"❌ Error loading team data: {str(e)}")
-        return EngineerStats(
-            developer_name=developer_name,
-            team_name=team_name,
-            total_time_saved=0.0,
-            total_entries=0,
-            average_efficiency=0.0,
-            recent_entries=[]
-        )
+        logger.error("❌ Error loading team data: %s", e)
+        return engineer_stats_response(developer_name, team_name)
     
     if df.empty:
-        print(f"📊 No data found for team {team_name}")
-        return EngineerStats(
-            developer_name=developer_name,
-            team_name=team_name,
-            total_time_saved=0.0,
-            total_entries=0,
-            average_efficiency=0.0,
-            recent_entries=[]
-        )
-    
-    engineer_df = df[df['Developer_Name'] == developer_name]
+        logger.debug("📊 No data found for team %s", team_name)
+        return engineer_stats_response(developer_name, team_name)
     
-    if engineer_df.empty:
-        print(f"📊 No entries found for developer {developer_name}")
-        return EngineerStats(
-            developer_name=developer_name,
-            team_name=team_name,
-            total_time_saved=0.0,
-            total_entries=0,
-            average_efficiency=0.0,
-            recent_entries=[]
-        )
+    # Totals and row positions come from a per-team view that is only rebuilt when the
+    # team's cached frame changes, so a dashboard hit is dict lookups plus a 10-row slice
+    developer = get_developer_index(team_name, df).get(developer_name)
     
-    # Calculate stats
-    total_time_saved = float(engineer_df['Efficiency_Gained_Hours'].sum())
-    total_entries = len(engineer_df)
+    if developer is None:
+        logger.debug("📊 No entries found for developer %s", developer_name)
+        return engineer_stats_response(developer_name, team_name)
     
-    print(f"📊 Developer {developer_name} stats: {total_entries} entries, {total_time_saved}h saved")
+    total_time_saved = developer["total_time_saved"]
+    total_entries = len(developer["positions"])
     
-    # Calculate average efficiency
-    valid_estimates = engineer_df[engineer_df['Original_Estimate_Hours'] > 0]
-    if not valid_estimates.empty:
-        average_efficiency = float(
-            (valid_estimates['Efficiency_Gained_Hours'].sum() / 
-             valid_estimates['Original_Estimate_Hours'].sum()) * 100
-        )
-    else:
-        average_efficiency = 0.0
+    logger.debug("📊 Developer %s stats: %d entries, %sh saved", developer_name, total_entries, total_time_saved)
     
-    # Get recent entries (last 10)
-    recent_entries = engineer_df.tail(10).to_dict('records')
+    # Calculate average efficiency over entries with a positive estimate
+    valid_estimate_total = developer["valid_estimate"]
+    average_efficiency = float(
+        developer["valid_time_saved"] / valid_estimate_total * 100
+    ) if valid_estimate_total > 0 else 0.0
     
-    # Convert pandas data types to Python native types for JSON serialization
-    for entry in recent_entries:
-        for key, value in entry.items():
-            if pd.isna(value):
-                entry[key] = None
-            elif isinstance(value, (pd.Timestamp, pd.Period)):
-                entry[key] = str(value)
-            elif hasattr(value, 'item'):  # numpy types
-                entry[key] = value.item()
+    # Get recent entries as JSON-safe records, converted once per team frame version and then
+    # served from the developer's view like the totals
+    recent_entries = developer.get("recent_entries")
+    if recent_entries is None:
+        recent_entries = developer["recent_entries"] = dataframe_to_records(
+            df.iloc[developer["positions"][-RECENT_ENTRIES_COUNT:]]
+        )
     
-    print(f"✅ Returning dashboard data for {developer_name}")
-    return EngineerStats(
-        developer_name=developer_name,
-        team_name=team_name,
+    logger.debug("✅ Returning dashboard data for %s", developer_name)
+    return engineer_stats_response(
+        developer_name,
+        team_name,
         total_time_saved=total_time_saved,
         total_entries=total_entries,
         average_efficiency=average_efficiency,
@@ -217,15 +337,15 @@ async def get_team_settings():
     """Get team settings for form options - no authentication required for testing"""
     try:
         settings_manager = get_team_settings_manager_instance()
-        settings = settings_manager.load_team_settings()
+        settings = await run_in_threadpool(settings_manager.load_team_settings)
         
-        print("✅ Loaded team settings successfully")
+        logger.debug("✅ Loaded team settings successfully")
         return {
             "success": True,
             "data": settings
         }
     except Exception as e:
-        print(f"❌ Error loading team settings: {str(e)}")
+        logger.error("❌ Error loading team settings: %s", e)
         # Return default settings as fallback
         return {
             "success": True,
@@ -266,54 +386,42 @@ async def get_entries(
     try:
         data_manager = get_data_manager_instance()
         
-        print(f"🔍 Getting entries for developer: {developer_name}, team: {team_name}")
+        logger.debug("🔍 Getting entries for developer: %s, team: %s", developer_name, team_name)
         
-        if not developer_name or not team_name:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Missing developer name or team. Developer: {developer_name}, Team: {team_name}"
-            )
+        require_developer_and_team(developer_name, team_name)
         
         # Get week dates
         selected_monday, selected_sunday = get_week_dates(week_date)
-        print(f"📅 Week dates: {selected_monday} to {selected_sunday}")
+        logger.debug("📅 Week dates: %s to %s", selected_monday, selected_sunday)
         
         # Load team data
-        print(f"📂 Loading team data for: {team_name}")
-        df = data_manager.load_team_data(team_name)
-        print(f"📊 Loaded {len(df)} total entries")
-        
-        # Filter for the specific week and developer
-        week_start_str = selected_monday.strftime('%Y-%m-%d')
-        developer_entries = df[
-            (df['Week'] == week_start_str) & 
-            (df['Developer_Name'] == developer_name)
-        ]
+        logger.debug("📂 Loading team data for: %s", team_name)
+        df = await run_in_threadpool(data_manager.load_team_data, team_name, copy=False)
+        logger.debug("📊 Loaded %d total entries", len(df))
         
-        print(f"📋 Found {len(developer_entries)} entries for {developer_name} in week {week_start_str}")
+        # Filter the cached frame for the specific week and developer with numpy masks
+        if df.empty:
+            developer_entries = df
+        else:
+            mask = df['Developer_Name'].eq(developer_name).to_numpy(dtype=bool, na_value=False)
+            mask &= df['Week'].to_numpy() == np.datetime64(selected_monday)
+            developer_entries = df[mask]
         
-        # Convert to list of dictionaries
-        entries = developer_entries.to_dict('records')
+        logger.debug("📋 Found %d entries for %s in week %s", len(developer_entries), developer_name, selected_monday)
         
-        # Convert pandas data types to Python native types
-        for entry in entries:
-            for key, value in entry.items():
-                if pd.isna(value):
-                    entry[key] = None
-                elif isinstance(value, (pd.Timestamp, pd.Period)):
-                    entry[key] = str(value)
-                elif hasattr(value, 'item'):  # numpy types
-                    entry[key] = value.item()
+        # Convert to JSON-safe records
+        entries = dataframe_to_records(developer_entries)
         
-        return EntriesResponse(
-            success=True,
-            entries=entries
-        )
+        # Records are already JSON-native; return the response directly to skip jsonable_encoder
+        return ORJSONResponse({
+            "success": True,
+            "entries": entries
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Unexpected error getting entries: {str(e)}")
+        logger.error("❌ Unexpected error getting entries: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Unexpected error getting entries: {str(e)}"
@@ -2,64 +2,135 @@
 Simple Teams router with S3 backend and no authentication for testing
 """
 
-from fastapi import APIRouter, HTTPException, status, Request
-from typing import List, Dict, Optional
+from fastapi import APIRouter, HTTPException, status, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from typing import Any, List, Dict, Optional
+import hashlib
+import logging
 import os
+from urllib.parse import quote
+import orjson
 
 from models.schemas import (
-    Team, CreateTeamRequest, AddDeveloperRequest, Developer, ApiResponse
+    Team, CreateTeamRequest, AddDeveloperRequest, ApiResponse
 )
-from core.database import get_teams_config_manager_instance
+from core.auth import hash_password_async
+from core.database import get_teams_config_manager_instance, update_teams_config
+from core.http_cache import make_etag, etag_matches, set_cache_headers, not_modified_response
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+FRONTEND_URL = os.getenv("FRONTEND_URL", "https://bynixti6xn.us-east-1.awsapprunner.com")
+ENGINEER_LINK_PREFIX = f"{FRONTEND_URL}/engineer?team="
+
+# Encoded /list response for the current teams config object: (config, body, ETag)
+_team_list_cache: Optional[tuple] = None
+
+# Encoded /get-team responses for the current teams config object: (config, {team_name: (body, ETag)})
+_team_detail_cache: Optional[tuple] = None
 
 
 def generate_engineer_link(developer_name: str, team_name: str) -> str:
     """Generate an access link for an engineer"""
-    frontend_url = os.getenv("FRONTEND_URL", "https://bynixti6xn.us-east-1.awsapprunner.com")
-    return f"{frontend_url}/engineer?team={team_name}&dev={developer_name}"
+    # Encode the names so spaces, '&' or '#' in them can't break the query string
+    return f"{ENGINEER_LINK_PREFIX}{quote(team_name, safe='')}&dev={quote(developer_name, safe='')}"
+
+
+def developer_payloads(team_data: Any) -> List[Dict[str, Any]]:
+    """Team developers in the Developer response shape, built as plain dicts for direct orjson encoding"""
+    developers = []
+    
+    # Handle both old and new data structures
+    if isinstance(team_data, list):
+        for dev in team_data:
+            if isinstance(dev, dict):
+                developers.append({
+                    "name": dev.get('name', ''),
+                    "email": dev.get('email', ''),
+                    "employee_id": dev.get('employee_id', ''),
+                    "password": dev.get('password', ''),
+                    "link": dev.get('link', '')
+                })
+            else:
+                # Handle old format where it's just a string
+                developers.append({"name": str(dev), "email": '', "employee_id": None, "password": None, "link": None})
+    
+    return developers
+
+
+def team_list_body(teams_config: Dict[str, Any]) -> tuple:
+    """Serialized /list body and its ETag, rebuilt only when the cached teams config is replaced"""
+    global _team_list_cache
+    cached = _team_list_cache
+    if cached is not None and cached[0] is teams_config:
+        return cached[1], cached[2]
+    
+    teams = [
+        {
+            "name": team_name,
+            "description": f"Team {team_name}",  # Default description
+            "developers": developer_payloads(team_data)
+        }
+        for team_name, team_data in teams_config.items()
+    ]
+    body = orjson.dumps(teams)
+    etag = make_etag("teams-list", hashlib.blake2b(body, digest_size=16).hexdigest())
+    
+    _team_list_cache = (teams_config, body, etag)
+    return body, etag
+
+
+def team_detail_body(teams_config: Dict[str, Any], team_name: str) -> tuple:
+    """Serialized /get-team body and its ETag for one team, kept until the cached teams config is replaced"""
+    global _team_detail_cache
+    cached = _team_detail_cache
+    if cached is None or cached[0] is not teams_config:
+        cached = _team_detail_cache = (teams_config, {})
+    
+    entry = cached[1].get(team_name)
+    if entry is None:
+        body = orjson.dumps({
+            "name": team_name,
+            "description": None,
+            "developers": developer_payloads(teams_config[team_name])
+        })
+        etag = make_etag("team-details", team_name, hashlib.blake2b(body, digest_size=16).hexdigest())
+        entry = cached[1][team_name] = (body, etag)
+    return entry
 
 
-@router.get("/list", response_model=List[Team])
-async def list_all_teams():
+def cached_body_response(request: Request, body: bytes, etag: str) -> Response:
+    """JSON response for a pre-serialized body; HEAD gets the same headers (Content-Length included) and no body"""
+    if request.method == "HEAD":
+        response = Response(media_type="application/json", headers={"Content-Length": str(len(body))})
+    else:
+        response = Response(content=body, media_type="application/json")
+    # Always revalidate: teams must reflect edits immediately, and a match costs only a 304
+    set_cache_headers(response, etag, max_age=0)
+    return response
+
+
+@router.api_route("/list", methods=["GET", "HEAD"], response_model=List[Team])
+async def list_all_teams(request: Request):
     """Get all teams from S3 - no authentication required for testing"""
     
-    print(f"🔍 list_all_teams called (no auth) - loading from S3")
+    logger.debug("🔍 list_all_teams called (no auth) - loading from S3")
     
     try:
         teams_config_manager = get_teams_config_manager_instance()
-        teams_config = teams_config_manager.load_teams_config()
+        teams_config = await run_in_threadpool(teams_config_manager.load_teams_config)
         
-        teams = []
-        for team_name, team_data in teams_config.items():
-            developers = []
-            
-            # Handle both old and new data structures
-            if isinstance(team_data, list):
-                for dev in team_data:
-                    if isinstance(dev, dict):
-                        developers.append(Developer(
-                            name=dev.get('name', ''),
-                            email=dev.get('email', ''),
-                            employee_id=dev.get('employee_id', ''),
-                            password=dev.get('password', ''),
-                            link=dev.get('link', '')
-                        ))
-                    else:
-                        # Handle old format where it's just a string
-                        developers.append(Developer(name=str(dev), email=''))
-            
-            teams.append(Team(
-                name=team_name,
-                description=f"Team {team_name}",  # Default description
-                developers=developers
-            ))
+        # The same config object is returned until it changes, so its encoded listing is reused as-is
+        body, etag = team_list_body(teams_config)
+        if etag_matches(request, etag):
+            return not_modified_response(etag, max_age=0)
         
-        print(f"✅ Loaded {len(teams)} teams from S3")
-        return teams
+        logger.debug("✅ Loaded %d teams from S3", len(teams_config))
+        return cached_body_response(request, body, etag)
         
     except Exception as e:
-        print(f"❌ Failed to load teams from S3: {str(e)}")
+        logger.error("❌ Failed to load teams from S3: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to load teams from S3: {str(e)}"
@@ -71,22 +142,20 @@ async def list_all_teams():
 async def create_new_team(team_data: CreateTeamRequest):
     """Create a new team in S3 - no authentication required for testing"""
     
-    print(f"🔍 create_new_team called: {team_data.team_name}")
+    logger.debug("🔍 create_new_team called: %s", team_data.team_name)
     
     try:
-        teams_config_manager = get_teams_config_manager_instance()
-        teams_config = teams_config_manager.load_teams_config()
-        
-        if team_data.team_name in teams_config:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Team '{team_data.team_name}' already exists"
-            )
-        
-        teams_config[team_data.team_name] = []
+        def create_team(teams_config):
+            if team_data.team_name in teams_config:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Team '{team_data.team_name}' already exists"
+                )
+            
+            teams_config[team_data.team_name] = []
         
-        if teams_config_manager.save_teams_config(teams_config):
-            print(f"✅ Team '{team_data.team_name}' created successfully in S3")
+        if await update_teams_config(create_team):
+            logger.info("✅ Team '%s' created successfully in S3", team_data.team_name)
             return ApiResponse(
                 success=True,
                 message=f"Team '{team_data.team_name}' created successfully"
@@ -100,7 +169,7 @@ async def create_new_team(team_data: CreateTeamRequest):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Failed to create team: {str(e)}")
+        logger.error("❌ Failed to create team: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create team: {str(e)}"
@@ -114,33 +183,45 @@ async def add_developer_to_team(
 ):
     """Add a developer to a team in S3 - no authentication required for testing"""
     
-    print(f"🔍 add_developer_to_team called: {developer_data.dev_name} to {team_name}")
+    logger.debug("🔍 add_developer_to_team called: %s to %s", developer_data.dev_name, team_name)
     
     try:
-        teams_config_manager = get_teams_config_manager_instance()
-        teams_config = teams_config_manager.load_teams_config()
-        
-        if team_name not in teams_config:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Team '{team_name}' not found"
-            )
-        
         # Generate access link
         access_link = generate_engineer_link(developer_data.dev_name, team_name)
         
+        # Store a hash, never the plaintext password; hashed before queueing so the
+        # slow KDF doesn't hold up other config edits
+        password = developer_data.dev_password
+        if password:
+            password = await hash_password_async(password)
+        
         developer = {
             'name': developer_data.dev_name,
             'email': developer_data.dev_email,
             'employee_id': developer_data.dev_employee_id,
-            'password': developer_data.dev_password,
+            'password': password,
             'link': access_link
         }
         
-        teams_config[team_name].append(developer)
+        def add_developer(teams_config):
+            if team_name not in teams_config:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Team '{team_name}' not found"
+                )
+            
+            # Logins resolve developers by name, so a second entry with the same name could never sign in
+            team_data = teams_config[team_name]
+            if any((dev.get('name') if isinstance(dev, dict) else dev) == developer_data.dev_name for dev in team_data):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Developer '{developer_data.dev_name}' already exists in team '{team_name}'"
+                )
+            
+            team_data.append(developer)
         
-        if teams_config_manager.save_teams_config(teams_config):
-            print(f"✅ Developer '{developer_data.dev_name}' added to '{team_name}' in S3")
+        if await update_teams_config(add_developer):
+            logger.info("✅ Developer '%s' added to '%s' in S3", developer_data.dev_name, team_name)
             return ApiResponse(
                 success=True,
                 message=f"{developer_data.dev_name} added to {team_name}",
@@ -155,7 +236,7 @@ async def add_developer_to_team(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Failed to add developer: {str(e)}")
+        logger.error("❌ Failed to add developer: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to add developer: {str(e)}"
@@ -169,33 +250,31 @@ async def remove_developer_from_team(
 ):
     """Remove a developer from a team in S3 - no authentication required for testing"""
     
-    print(f"🔍 remove_developer_from_team called: {developer_name} from {team_name}")
+    logger.debug("🔍 remove_developer_from_team called: %s from %s", developer_name, team_name)
     
     try:
-        teams_config_manager = get_teams_config_manager_instance()
-        teams_config = teams_config_manager.load_teams_config()
-        
-        if team_name not in teams_config:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Team '{team_name}' not found"
-            )
-        
-        # Find and remove the developer
-        team_data = teams_config[team_name]
-        for i, dev in enumerate(team_data):
-            dev_name = dev['name'] if isinstance(dev, dict) else dev
-            if dev_name == developer_name:
-                team_data.pop(i)
-                break
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Developer '{developer_name}' not found in team '{team_name}'"
-            )
+        def remove_developer(teams_config):
+            if team_name not in teams_config:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Team '{team_name}' not found"
+                )
+            
+            # Find and remove the developer
+            team_data = teams_config[team_name]
+            for i, dev in enumerate(team_data):
+                dev_name = dev['name'] if isinstance(dev, dict) else dev
+                if dev_name == developer_name:
+                    team_data.pop(i)
+                    break
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Developer '{developer_name}' not found in team '{team_name}'"
+                )
         
-        if teams_config_manager.save_teams_config(teams_config):
-            print(f"✅ Developer '{developer_name}' removed from '{team_name}' in S3")
+        if await update_teams_config(remove_developer):
+            logger.info("✅ Developer '%s' removed from '%s' in S3", developer_name, team_name)
             return ApiResponse(
                 success=True,
                 message=f"{developer_name} removed from {team_name}"
@@ -209,7 +288,7 @@ async def remove_developer_from_team(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Failed to remove developer: {str(e)}")
+        logger.error("❌ Failed to remove developer: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to remove developer: {str(e)}"
@@ -220,22 +299,20 @@ async def remove_developer_from_team(
 async def delete_entire_team(team_name: str):
     """Delete a team from S3 - no authentication required for testing"""
     
-    print(f"🔍 delete_entire_team called: {team_name}")
+    logger.debug("🔍 delete_entire_team called: %s", team_name)
     
     try:
-        teams_config_manager = get_teams_config_manager_instance()
-        teams_config = teams_config_manager.load_teams_config()
-        
-        if team_name not in teams_config:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Team '{team_name}' not found"
-            )
-        
-        del teams_config[team_name]
+        def delete_team(teams_config):
+            if team_name not in teams_config:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Team '{team_name}' not found"
+                )
+            
+            del teams_config[team_name]
         
-        if teams_config_manager.save_teams_config(teams_config):
-            print(f"✅ Team '{team_name}' deleted successfully from S3")
+        if await update_teams_config(delete_team):
+            logger.info("✅ Team '%s' deleted successfully from S3", team_name)
             return ApiResponse(
                 success=True,
                 message=f"Team '{team_name}' deleted successfully"
@@ -249,22 +326,22 @@ async def delete_entire_team(team_name: str):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Failed to delete team: {str(e)}")
+        logger.error("❌ Failed to delete team: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete team: {str(e)}"
         )
 
 
-@router.get("/get-team", response_model=Team)
-async def get_team_details(team_name: str):
+@router.api_route("/get-team", methods=["GET", "HEAD"], response_model=Team)
+async def get_team_details(request: Request, team_name: str):
     """Get a specific team from S3 - no authentication required for testing"""
     
-    print(f"🔍 get_team_details called: {team_name}")
+    logger.debug("🔍 get_team_details called: %s", team_name)
     
     try:
         teams_config_manager = get_teams_config_manager_instance()
-        teams_config = teams_config_manager.load_teams_config()
+        teams_config = await run_in_threadpool(teams_config_manager.load_teams_config)
         
         if team_name not in teams_config:
             raise HTTPException(
@@ -272,30 +349,17 @@ async def get_team_details(team_name: str):
                 detail=f"Team '{team_name}' not found"
             )
         
-        team_data = teams_config[team_name]
-        developers = []
-        
-        # Handle both old and new data structures
-        if isinstance(team_data, list):
-            for dev in team_data:
-                if isinstance(dev, dict):
-                    developers.append(Developer(
-                        name=dev.get('name', ''),
-                        email=dev.get('email', ''),
-                        employee_id=dev.get('employee_id', ''),
-                        password=dev.get('password', ''),
-                        link=dev.get('link', '')
-                    ))
-                else:
-                    developers.append(Developer(name=str(dev), email=''))
+        body, etag = team_detail_body(teams_config, team_name)
+        if etag_matches(request, etag):
+            return not_modified_response(etag, max_age=0)
         
-        print(f"✅ Team '{team_name}' retrieved from S3 with {len(developers)} developers")
-        return Team(name=team_name, developers=developers)
+        logger.debug("✅ Team '%s' retrieved from S3", team_name)
+        return cached_body_response(request, body, etag)
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Failed to get team details: {str(e)}")
+        logger.error("❌ Failed to get team details: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get team details: {str(e)}"
@@ -3,6 +3,30 @@
 
 import requests
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# requests doesn't document Session as thread-safe, so each thread keeps its own
+_thread_local = threading.local()
+
+def thread_session():
+    """Return this thread's Session, reused for its keep-alive connection across calls"""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
+
+def post_login(endpoint, test_case):
+    """Send one login attempt on the calling thread's Session"""
+    return thread_session().post(
+        endpoint,
+        json={
+            "email": test_case["email"],
+            "password": test_case["password"]
+        },
+        headers={"Content-Type": "application/json"},
+        timeout=10
+    )
 
 def test_email_login():
     """Test the new email login endpoint"""
@@ -35,21 +59,17 @@ def test_email_login():
     # Correct endpoint path - note it's NOT under /api/auth/
     endpoint = f"{base_url}/api/engineer/login-email"
     
-    for i, test_case in enumerate(test_cases, 1):
+    # The probes are independent, so send them all at once and report in order
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        pending = [executor.submit(post_login, endpoint, test_case) for test_case in test_cases]
+    
+    for i, (test_case, future) in enumerate(zip(test_cases, pending), 1):
         print(f"\n📧 Test {i}: {test_case['email']}")
         print(f"Expected: {test_case['expected']}")
         print(f"Endpoint: {endpoint}")
         
         try:
-            response = requests.post(
-                endpoint,
-                json={
-                    "email": test_case["email"],
-                    "password": test_case["password"]
-                },
-                headers={"Content-Type": "application/json"},
-                timeout=10
-            )
+            response = future.result()
             
             print(f"Status: {response.status_code}")
             print(f"Response: {response.text}")
@@ -71,7 +91,7 @@ def test_email_login():
     # Test endpoint existence
     print(f"\n🔍 Testing endpoint existence...")
     try:
-        response = requests.options(endpoint, timeout=5)
+        response = thread_session().options(endpoint, timeout=5)
         print(f"OPTIONS request status: {response.status_code}")
         if response.status_code in [200, 405]:
             print("✅ Endpoint exists")
@@ -0,0 +1,99 @@
+"""
+Team data round-trips for legacy files whose text columns mix value types
+"""
+
+import io
+import itertools
+import unittest
+from unittest import mock
+
+import pandas as pd
+import pyarrow as pa
+from botocore.exceptions import ClientError
+
+from core import database
+from core.database import DataManager
+from core.serialization import dataframe_to_arrow_stream
+
+
+class InMemoryS3:
+    """Just enough of the S3 client API for DataManager: objects kept in a dict with ETags and modification order"""
+
+    def __init__(self):
+        self.objects = {}
+        self._clock = itertools.count()
+
+    @staticmethod
+    def _error(code: str) -> ClientError:
+        return ClientError({'Error': {'Code': code, 'Message': code}}, 'S3')
+
+    def head_bucket(self, Bucket):
+        return {}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        etag = f'"{next(self._clock)}"'
+        self.objects[Key] = (bytes(Body), etag, next(self._clock))
+        return {'ETag': etag}
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise self._error('404')
+        _, etag, modified = self.objects[Key]
+        return {'ETag': etag, 'LastModified': modified}
+
+    def get_object(self, Bucket, Key, IfNoneMatch=None):
+        if Key not in self.objects:
+            raise self._error('NoSuchKey')
+        body, etag, modified = self.objects[Key]
+        if IfNoneMatch == etag:
+            raise self._error('304')
+        return {'Body': io.BytesIO(body), 'ETag': etag, 'LastModified': modified}
+
+
+class MixedStoryIdTests(unittest.TestCase):
+    def setUp(self):
+        self.s3 = InMemoryS3()
+        patcher = mock.patch.object(database, 'get_s3_client', return_value=self.s3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # A legacy sheet: numeric story IDs and notes mixed in with text ones
+        self.legacy = pd.DataFrame({
+            'Week': ['2024-01-01', '2024-01-08', '2024-01-15'],
+            'Story_ID': ['ABC-1', 42, 'ABC-3'],
+            'Developer_Name': ['alice', 'bob', 'alice'],
+            'Original_Estimate_Hours': [8, 5, 3],
+            'Efficiency_Gained_Hours': [2, 1, 0.5],
+            'Notes': ['first', 7, None],
+        })
+
+    def new_manager(self) -> DataManager:
+        return DataManager(use_s3=True, s3_bucket='bucket')
+
+    def test_save_writes_parquet_mirror(self):
+        self.assertTrue(self.new_manager().save_team_data('Team A', self.legacy))
+        self.assertIn('teams/Team%20A_efficiency_data.parquet', self.s3.objects)
+
+    def test_round_trip_through_mirror_and_arrow(self):
+        self.new_manager().save_team_data('Team A', self.legacy)
+
+        # A fresh manager has no cached frame, so the load is served from the parquet mirror
+        manager = self.new_manager()
+        with mock.patch.object(pd, 'read_excel', side_effect=AssertionError('xlsx parsed')):
+            df = manager.load_team_data('Team A')
+
+        self.assertEqual(df['Story_ID'].tolist(), ['ABC-1', '42', 'ABC-3'])
+        self.assertEqual(df['Notes'].tolist()[:2], ['first', '7'])
+        self.assertTrue(pd.isna(df['Notes'].iloc[2]))
+
+        table = pa.ipc.open_stream(dataframe_to_arrow_stream(df)).read_all()
+        self.assertEqual(table.column('Story_ID').to_pylist(), ['ABC-1', '42', 'ABC-3'])
+
+    def test_arrow_stream_accepts_unnormalized_mixed_columns(self):
+        table = pa.ipc.open_stream(dataframe_to_arrow_stream(self.legacy)).read_all()
+        self.assertEqual(table.column('Story_ID').to_pylist(), ['ABC-1', '42', 'ABC-3'])
+        self.assertEqual(table.column('Original_Estimate_Hours').type, pa.int64())
+
+
+if __name__ == '__main__':
+    unittest.main()